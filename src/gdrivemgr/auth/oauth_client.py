@@ -3,6 +3,8 @@
 from __future__ import annotations
 
 import os
+import threading
+from functools import lru_cache
 from typing import Sequence
 
 from gdrivemgr.errors import AuthError, InvalidArgumentError
@@ -17,6 +19,9 @@ class OAuthClient:
         if auth_info.kind != "oauth":
             raise InvalidArgumentError("OAuthClient requires AuthInfo(kind='oauth')")
         self._auth_info = auth_info
+        # Credentials are cached per client and refreshed in place when needed.
+        self._creds = None
+        self._lock = threading.Lock()
 
     def get_credentials(self, scopes: Sequence[str], ensure_valid: bool = True):
         """
@@ -47,62 +52,58 @@ class OAuthClient:
                 cause=exc,
             ) from exc
 
-        token_file = self._auth_info.token_file
-        creds = None
-
-        if os.path.exists(token_file):
-            try:
-                creds = Credentials.from_authorized_user_file(
-                    token_file,
-                    scopes=list(scopes),
-                )
-            except Exception as exc:
-                raise AuthError(
-                    "Failed to load token_file",
-                    details={"token_file": token_file},
-                    cause=exc,
-                ) from exc
-
-            # IMPORTANT:
-            # When ensure_valid is False, return loaded credentials as-is.
-            if not ensure_valid:
-                return creds
-
-            # ensure_valid=True: refresh if possible.
-            if not creds.valid and creds.refresh_token:
-                try:
-                    creds.refresh(Request())
-                    self._save_credentials(creds)
-                except Exception as exc:
-                    raise AuthError(
-                        "Failed to refresh OAuth credentials",
-                        details={"token_file": token_file},
-                        cause=exc,
-                    ) from exc
-
-            if creds.valid:
-                return creds
-
-        # No token, or token could not be validated/refreshed -> run OAuth flow.
-        client_secrets = self._auth_info.client_secrets_file
-        try:
-            flow = InstalledAppFlow.from_client_secrets_file(
-                client_secrets,
-                scopes=list(scopes),
-            )
-            creds = flow.run_local_server(port=0)
-            self._save_credentials(creds)
+        with self._lock:
+            creds = self._creds if _covers_scopes(self._creds, scopes) else None
+            if creds is None:
+                creds = self._load_token_file(scopes, Credentials)
+            if creds is not None:
+                # IMPORTANT:
+                # When ensure_valid is False, return loaded credentials as-is.
+                if not ensure_valid:
+                    self._creds = creds
+                    return creds
+
+                # ensure_valid=True: refresh if possible.
+                if not creds.valid and creds.refresh_token:
+                    try:
+                        creds.refresh(Request())
+                        self._save_credentials(creds)
+                    except Exception as exc:
+                        raise AuthError(
+                            "Failed to refresh OAuth credentials",
+                            details={"token_file": self._auth_info.token_file},
+                            cause=exc,
+                        ) from exc
+
+                if creds.valid:
+                    self._creds = creds
+                    return creds
+
+            # No token, or token could not be validated/refreshed -> run OAuth flow.
+            creds = self._run_flow(scopes, InstalledAppFlow)
+            self._creds = creds
             return creds
-        except Exception as exc:
+
+    def build_http(self, scopes: Sequence[str], ensure_valid: bool = True):
+        """
+        Build an authorized HTTP transport (one per thread; not thread-safe).
+
+        Returns:
+            google_auth_httplib2.AuthorizedHttp
+        """
+        try:
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.http import build_http
+        except Exception as exc:  # pragma: no cover
             raise AuthError(
-                "OAuth authorization flow failed",
-                details={
-                    "client_secrets_file": client_secrets,
-                    "token_file": token_file,
-                },
+                "google-auth-httplib2 is not available",
+                details={"hint": "Install google-auth-httplib2"},
                 cause=exc,
             ) from exc
 
+        creds = self.get_credentials(scopes=scopes, ensure_valid=ensure_valid)
+        return AuthorizedHttp(creds, http=build_http())
+
     def build_drive_service(self, scopes: Sequence[str], ensure_valid: bool = True):
         """
         Build a Drive API service resource.
@@ -111,7 +112,7 @@ class OAuthClient:
             googleapiclient.discovery.Resource
         """
         try:
-            from googleapiclient.discovery import build
+            from googleapiclient.discovery import build_from_document
         except Exception as exc:  # pragma: no cover
             raise AuthError(
                 "google-api-python-client is not available",
@@ -119,12 +120,50 @@ class OAuthClient:
                 cause=exc,
             ) from exc
 
-        creds = self.get_credentials(scopes=scopes, ensure_valid=ensure_valid)
+        # One authorized Http per service: its keep-alive connections are
+        # reused by every request issued through the returned service.
+        http = self.build_http(scopes, ensure_valid=ensure_valid)
         try:
-            return build("drive", "v3", credentials=creds, cache_discovery=False)
+            return build_from_document(_drive_discovery_document(), http=http)
         except Exception as exc:
             raise AuthError("Failed to build Drive service", cause=exc) from exc
 
+    def _load_token_file(self, scopes: Sequence[str], credentials_cls):
+        token_file = self._auth_info.token_file
+        if not os.path.exists(token_file):
+            return None
+        try:
+            return credentials_cls.from_authorized_user_file(
+                token_file,
+                scopes=list(scopes),
+            )
+        except Exception as exc:
+            raise AuthError(
+                "Failed to load token_file",
+                details={"token_file": token_file},
+                cause=exc,
+            ) from exc
+
+    def _run_flow(self, scopes: Sequence[str], flow_cls):
+        client_secrets = self._auth_info.client_secrets_file
+        try:
+            flow = flow_cls.from_client_secrets_file(
+                client_secrets,
+                scopes=list(scopes),
+            )
+            creds = flow.run_local_server(port=0)
+            self._save_credentials(creds)
+            return creds
+        except Exception as exc:
+            raise AuthError(
+                "OAuth authorization flow failed",
+                details={
+                    "client_secrets_file": client_secrets,
+                    "token_file": self._auth_info.token_file,
+                },
+                cause=exc,
+            ) from exc
+
     def _save_credentials(self, creds) -> None:
         token_file = self._auth_info.token_file
         token_dir = os.path.dirname(token_file)
@@ -140,3 +179,27 @@ class OAuthClient:
                 details={"token_file": token_file},
                 cause=exc,
             ) from exc
+
+
+def _covers_scopes(creds, scopes: Sequence[str]) -> bool:
+    if creds is None:
+        return False
+    granted = getattr(creds, "scopes", None) or ()
+    return set(scopes).issubset(granted)
+
+
+@lru_cache(maxsize=None)
+def _drive_discovery_document() -> str:
+    """
+    Return the Drive v3 discovery document bundled with googleapiclient.
+
+    Read once per process and cached as the raw JSON string: each service built
+    from a parsed dict writes injected parameters back into it, so every
+    build_from_document call must parse its own copy.
+    """
+    from googleapiclient.discovery_cache import get_static_doc
+
+    doc = get_static_doc("drive", "v3")
+    if doc is None:
+        raise RuntimeError("Static Drive v3 discovery document not found")
+    return doc
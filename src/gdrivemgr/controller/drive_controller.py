@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import io
-import json
 import os
+import random
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dataclasses import dataclass
-from typing import Any, Callable, Optional, Sequence, TypeVar
+from datetime import datetime
+from typing import Any, Callable, Iterator, Optional, Sequence, TypeVar
 
 from gdrivemgr.auth import AuthInfo, OAuthClient
 from gdrivemgr.errors import (
     ApiError,
     AuthError,
+    GDriveMgrError,
     HttpErrorInfo,
     InvalidArgumentError,
     NetworkError,
@@ -23,10 +26,41 @@ from gdrivemgr.models import FileInfo
 from gdrivemgr.util.mime import is_google_docs_download_disallowed
 from gdrivemgr.util.time import parse_rfc3339
 
-from .fields import FILE_FIELDS, LIST_FIELDS
+from .fields import FILE_FIELDS, LIST_FIELDS, LIST_FIELDS_TREE
+
+try:  # optional: faster parsing of HTTP error payloads
+    import orjson as _json
+except ImportError:  # pragma: no cover
+    import json as _json
 
 T = TypeVar("T")
 
+# Drive API limit for calls packed into one batch request.
+_BATCH_MAX_REQUESTS = 100
+
+# Maximum files.list page size (the Drive default is 100).
+_LIST_PAGE_SIZE = 1000
+
+# Uploads larger than this use a resumable session (Drive recommends 5 MB).
+_RESUMABLE_UPLOAD_THRESHOLD = 5 * 1024 * 1024
+
+# Media download chunk size (the client library default is 100 KiB).
+_DOWNLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Methods accepted by apply_batch -> whether the call returns a FileInfo.
+_BATCH_METHODS: dict[str, bool] = {
+    "get": True,
+    "create_folder": True,
+    "copy": True,
+    "rename": True,
+    "move": True,
+    "trash": False,
+    "delete_permanently": False,
+}
+
+# Media calls accepted by transfer_many (Drive batches cannot carry media).
+_TRANSFER_METHODS = frozenset({"upload_file", "download_file"})
+
 
 @dataclass(frozen=True)
 class _RetryPolicy:
@@ -51,37 +85,47 @@ class GoogleDriveController:
         *,
         scopes: Optional[Sequence[str]] = None,
         supports_all_drives: bool = True,
+        max_workers: int = 4,
     ) -> None:
-        self._supports_all_drives = supports_all_drives
+        self._init_request_kwargs(supports_all_drives)
         self._retry_policy = _RetryPolicy()
 
         use_scopes = list(scopes) if scopes is not None else list(self.DEFAULT_SCOPES)
         client = OAuthClient(auth_info)
         self._service = client.build_drive_service(use_scopes, ensure_valid=True)
 
+        # Credentials were validated above; worker threads only load them.
+        self._init_workers(
+            max_workers,
+            lambda: client.build_http(use_scopes, ensure_valid=False),
+        )
+
     @classmethod
     def from_service(
         cls,
         service: Any,
         *,
         supports_all_drives: bool = True,
+        max_workers: int = 4,
+        http_factory: Optional[Callable[[], Any]] = None,
     ) -> "GoogleDriveController":
-        """Create controller from a pre-built Drive service (useful for tests)."""
+        """
+        Create controller from a pre-built Drive service (useful for tests).
+
+        Without `http_factory`, requests are never sent from worker threads.
+        """
         obj = cls.__new__(cls)
-        obj._supports_all_drives = supports_all_drives
+        obj._init_request_kwargs(supports_all_drives)
         obj._retry_policy = _RetryPolicy()
         obj._service = service
+        obj._init_workers(max_workers, http_factory)
         return obj
 
     # ----------------------------
     # Public API
     # ----------------------------
     def get(self, file_id: str) -> FileInfo:
-        req = self._service.files().get(
-            fileId=file_id,
-            fields=FILE_FIELDS,
-            **self._common_get_kwargs(),
-        )
+        req = self._get_request(file_id)
         data = self._execute(req.execute)
         return _file_dict_to_file_info(data)
 
@@ -99,32 +143,46 @@ class GoogleDriveController:
         root_id: str,
         *,
         include_trashed: bool = False,
+        full_metadata: bool = True,
     ) -> list[FileInfo]:
         """
-        Recursively list all items under root_id (BFS).
+        Recursively list all items under root_id (level-synchronous BFS).
+
+        All folders of one level are listed through Drive batch requests, so
+        round trips grow with the tree depth rather than the folder count.
+
+        Args:
+            full_metadata: If False, createdTime/size/md5Checksum are not
+                requested (smaller responses; those fields stay None).
 
         Returns:
             All descendants under root_id (root itself is not included).
         """
         results: list[FileInfo] = []
-        queue: list[str] = [root_id]
-        seen_folders: set[str] = set()
+        level: list[str] = [root_id]
+        seen_folders: set[str] = {root_id}
 
-        while queue:
-            parent_id = queue.pop(0)
-            if parent_id in seen_folders:
-                continue
-            seen_folders.add(parent_id)
-
-            children = self._list_children_raw(
-                parent_id,
+        while level:
+            children_by_parent = self._list_children_batch(
+                level,
                 include_trashed=include_trashed,
+                fields=LIST_FIELDS if full_metadata else LIST_FIELDS_TREE,
             )
-            results.extend(children)
 
-            for child in children:
-                if child.mime_type == "application/vnd.google-apps.folder":
-                    queue.append(child.file_id or child.local_id)
+            next_level: list[str] = []
+            for parent_id in level:
+                children = children_by_parent[parent_id]
+                results.extend(children)
+
+                for child in children:
+                    if not child.is_folder:
+                        continue
+                    child_id = child.file_id or child.local_id
+                    if child_id not in seen_folders:
+                        seen_folders.add(child_id)
+                        next_level.append(child_id)
+
+            level = next_level
 
         return results
 
@@ -144,51 +202,43 @@ class GoogleDriveController:
         return self._find_by_query(q)
 
     def create_folder(self, name: str, parent_id: str) -> FileInfo:
-        body = {"name": name, "mimeType": "application/vnd.google-apps.folder",
-                "parents": [parent_id]}
-        req = self._service.files().create(
-            body=body,
-            fields=FILE_FIELDS,
-            **self._common_write_kwargs(),
-        )
+        req = self._create_folder_request(name, parent_id)
         data = self._execute(req.execute)
         return _file_dict_to_file_info(data)
 
     def rename(self, file_id: str, new_name: str) -> FileInfo:
-        body = {"name": new_name}
-        req = self._service.files().update(
-            fileId=file_id,
-            body=body,
-            fields=FILE_FIELDS,
-            **self._common_write_kwargs(),
-        )
+        req = self._rename_request(file_id, new_name)
         data = self._execute(req.execute)
         return _file_dict_to_file_info(data)
 
-    def move(self, file_id: str, new_parent_id: str) -> FileInfo:
+    def move(
+        self,
+        file_id: str,
+        new_parent_id: str,
+        *,
+        old_parents: Optional[Sequence[str]] = None,
+    ) -> FileInfo:
         """
         Replace parents with new_parent_id.
 
+        Args:
+            old_parents: Current parents if already known by the caller.
+                When omitted, they are fetched with an extra files.get call.
+
         Note:
             This performs a parent replacement. Manager/Local side ensures
             multi-parent MOVE is forbidden in v1.
         """
-        current = self._service.files().get(
-            fileId=file_id,
-            fields="parents",
-            **self._common_get_kwargs(),
-        )
-        current_data = self._execute(current.execute)
-        old_parents = current_data.get("parents", [])
-        remove_parents = ",".join(old_parents) if old_parents else ""
+        if old_parents is None:
+            current = self._service.files().get(
+                fileId=file_id,
+                fields="parents",
+                **self._get_kw,
+            )
+            current_data = self._execute(current.execute)
+            old_parents = current_data.get("parents", [])
 
-        req = self._service.files().update(
-            fileId=file_id,
-            addParents=new_parent_id,
-            removeParents=remove_parents or None,
-            fields=FILE_FIELDS,
-            **self._common_write_kwargs(),
-        )
+        req = self._move_request(file_id, new_parent_id, old_parents)
         data = self._execute(req.execute)
         return _file_dict_to_file_info(data)
 
@@ -199,35 +249,56 @@ class GoogleDriveController:
         *,
         new_name: Optional[str] = None,
     ) -> FileInfo:
-        body: dict[str, Any] = {"parents": [new_parent_id]}
-        if new_name is not None:
-            body["name"] = new_name
-
-        req = self._service.files().copy(
-            fileId=file_id,
-            body=body,
-            fields=FILE_FIELDS,
-            **self._common_write_kwargs(),
-        )
+        req = self._copy_request(file_id, new_parent_id, new_name)
         data = self._execute(req.execute)
         return _file_dict_to_file_info(data)
 
     def trash(self, file_id: str) -> None:
-        body = {"trashed": True}
-        req = self._service.files().update(
-            fileId=file_id,
-            body=body,
-            fields="id",
-            **self._common_write_kwargs(),
-        )
-        self._execute(req.execute)
+        self._execute(self._trash_request(file_id).execute)
 
     def delete_permanently(self, file_id: str) -> None:
-        req = self._service.files().delete(
-            fileId=file_id,
-            **self._common_write_kwargs(),
-        )
-        self._execute(req.execute)
+        self._execute(self._delete_permanently_request(file_id).execute)
+
+    def apply_batch(
+        self,
+        calls: Sequence[tuple[str, tuple[Any, ...]]],
+    ) -> list[Any]:
+        """
+        Send metadata calls through Drive batch requests.
+
+        Args:
+            calls: (method, args) pairs. method is one of get, create_folder,
+                copy, rename, move, trash, delete_permanently; args are that
+                method's arguments in positional form (move requires
+                old_parents, copy takes new_name third).
+
+        Returns:
+            One outcome per call, in order: the FileInfo (None for trash and
+            delete_permanently), or the gdrivemgr error for that call. Errors
+            of individual calls are returned, not raised.
+        """
+        requests = []
+        for index, (method, args) in enumerate(calls):
+            if method not in _BATCH_METHODS:
+                raise InvalidArgumentError(
+                    "Unsupported batch method",
+                    details={"method": method},
+                )
+            build = getattr(self, f"_{method}_request")
+            requests.append((str(index), build(*args)))
+
+        outcomes = self._execute_batch_outcomes(requests)
+
+        results: list[Any] = []
+        for (method, _), (request_id, _) in zip(calls, requests):
+            outcome = outcomes[request_id]
+            if isinstance(outcome, GDriveMgrError):
+                results.append(outcome)
+            elif _BATCH_METHODS[method]:
+                results.append(_file_dict_to_file_info(outcome))
+            else:
+                results.append(None)
+        return results
 
     def upload_file(
         self,
@@ -235,6 +306,136 @@ class GoogleDriveController:
         parent_id: str,
         *,
         name: Optional[str] = None,
+    ) -> FileInfo:
+        return self._upload_file(local_path, parent_id, name)
+
+    def download_file(
+        self,
+        file_id: str,
+        local_path: str,
+        *,
+        overwrite: bool = False,
+    ) -> None:
+        self._download_file(file_id, local_path, overwrite)
+
+    def transfer_many(
+        self,
+        calls: Sequence[tuple[str, tuple[Any, ...]]],
+    ) -> dict[int, Any]:
+        """
+        Run uploads/downloads concurrently on worker threads.
+
+        Args:
+            calls: (method, args) pairs. method is upload_file or
+                download_file; args are positional (upload_file: local_path,
+                parent_id, name; download_file: file_id, local_path,
+                overwrite).
+
+        Returns:
+            call index -> outcome (FileInfo for uploads, None for downloads,
+            or the gdrivemgr error of that call) for every call that ran.
+            After the first failure, calls not started yet are cancelled and
+            left out.
+
+        Note:
+            Without a per-thread HTTP factory, calls run one by one.
+        """
+        for method, _ in calls:
+            if method not in _TRANSFER_METHODS:
+                raise InvalidArgumentError(
+                    "Unsupported transfer method",
+                    details={"method": method},
+                )
+
+        outcomes: dict[int, Any] = {}
+        if len(calls) == 1 or not self._can_run_parallel():
+            for index, (method, args) in enumerate(calls):
+                try:
+                    outcomes[index] = getattr(self, f"_{method}")(*args)
+                except GDriveMgrError as exc:
+                    outcomes[index] = exc
+                    break
+            return outcomes
+
+        executor = self._get_executor()
+        futures = {
+            executor.submit(self._transfer_on_thread_http, method, args): index
+            for index, (method, args) in enumerate(calls)
+        }
+        for future in as_completed(futures):
+            if future.cancelled():
+                continue
+            outcome = future.result()
+            outcomes[futures[future]] = outcome
+            if isinstance(outcome, GDriveMgrError):
+                for pending in futures:
+                    pending.cancel()
+        return outcomes
+
+    # ----------------------------
+    # Internals
+    # ----------------------------
+    def _init_workers(
+        self,
+        max_workers: int,
+        http_factory: Optional[Callable[[], Any]],
+    ) -> None:
+        if max_workers < 1:
+            raise InvalidArgumentError("max_workers must be >= 1")
+        self._max_workers = max_workers
+        self._http_factory = http_factory
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._thread_local = threading.local()
+
+    def _can_run_parallel(self) -> bool:
+        return self._max_workers > 1 and self._http_factory is not None
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers,
+                thread_name_prefix="gdrivemgr",
+            )
+        return self._executor
+
+    def _thread_http(self) -> Any:
+        """Return this thread's own HTTP object (httplib2 is not thread-safe)."""
+        http = getattr(self._thread_local, "http", None)
+        if http is None:
+            http = self._http_factory()  # type: ignore[misc]
+            self._thread_local.http = http
+        return http
+
+    def _execute_on_thread_http(self, func: Callable[..., T]) -> T:
+        return self._execute(lambda: func(http=self._thread_http()))
+
+    def _init_request_kwargs(self, supports_all_drives: bool) -> None:
+        # Built once; call sites unpack them with ** (never mutated).
+        self._supports_all_drives = supports_all_drives
+        if supports_all_drives:
+            self._get_kw: dict[str, Any] = {"supportsAllDrives": True}
+            self._list_kw: dict[str, Any] = {
+                "supportsAllDrives": True,
+                "includeItemsFromAllDrives": True,
+            }
+            self._write_kw: dict[str, Any] = {"supportsAllDrives": True}
+        else:
+            self._get_kw = {}
+            self._list_kw = {}
+            self._write_kw = {}
+
+    def _transfer_on_thread_http(self, method: str, args: tuple[Any, ...]) -> Any:
+        try:
+            return getattr(self, f"_{method}")(*args, http=self._thread_http())
+        except GDriveMgrError as exc:
+            return exc
+
+    def _upload_file(
+        self,
+        local_path: str,
+        parent_id: str,
+        name: Optional[str] = None,
+        http: Any = None,
     ) -> FileInfo:
         if not local_path or not isinstance(local_path, str):
             raise InvalidArgumentError("local_path must be a non-empty string")
@@ -248,24 +449,27 @@ class GoogleDriveController:
             ) from exc
 
         filename = name if name is not None else os.path.basename(local_path)
-        media = MediaFileUpload(local_path, resumable=True)
+        # Small files go in a single multipart request; resumable uploads
+        # cost an extra round trip to open the upload session.
+        resumable = os.path.getsize(local_path) > _RESUMABLE_UPLOAD_THRESHOLD
+        media = MediaFileUpload(local_path, resumable=resumable)
         body = {"name": filename, "parents": [parent_id]}
 
         req = self._service.files().create(
             body=body,
             media_body=media,
             fields=FILE_FIELDS,
-            **self._common_write_kwargs(),
+            **self._write_kw,
         )
-        data = self._execute(req.execute)
+        data = self._execute(_with_http(req, http).execute)
         return _file_dict_to_file_info(data)
 
-    def download_file(
+    def _download_file(
         self,
         file_id: str,
         local_path: str,
-        *,
         overwrite: bool = False,
+        http: Any = None,
     ) -> None:
         if not overwrite and os.path.exists(local_path):
             raise InvalidArgumentError(
@@ -273,7 +477,8 @@ class GoogleDriveController:
                 details={"local_path": local_path},
             )
 
-        info = self.get(file_id)
+        info_req = _with_http(self._get_request(file_id), http)
+        info = _file_dict_to_file_info(self._execute(info_req.execute))
         if is_google_docs_download_disallowed(info.mime_type):
             raise InvalidArgumentError(
                 "Google Docs type is not supported for download in v1",
@@ -290,7 +495,7 @@ class GoogleDriveController:
 
         req = self._service.files().get_media(
             fileId=file_id,
-            **self._common_get_kwargs(),
+            **self._get_kw,
         )
 
         parent_dir = os.path.dirname(local_path)
@@ -298,29 +503,86 @@ class GoogleDriveController:
             os.makedirs(parent_dir, exist_ok=True)
 
         with open(local_path, "wb") as f:
-            downloader = MediaIoBaseDownload(fd
-                                             =io.BufferedWriter(f), request=req)
+            downloader = MediaIoBaseDownload(
+                fd=f,
+                request=_with_http(req, http),
+                chunksize=_DOWNLOAD_CHUNK_SIZE,
+            )
             done = False
             while not done:
                 status, done = self._execute(downloader.next_chunk)  # type: ignore[misc]
 
-    # ----------------------------
-    # Internals
-    # ----------------------------
-    def _common_get_kwargs(self) -> dict[str, Any]:
-        if not self._supports_all_drives:
-            return {}
-        return {"supportsAllDrives": True}
+    def _get_request(self, file_id: str) -> Any:
+        return self._service.files().get(
+            fileId=file_id,
+            fields=FILE_FIELDS,
+            **self._get_kw,
+        )
+
+    def _create_folder_request(self, name: str, parent_id: str) -> Any:
+        body = {"name": name, "mimeType": "application/vnd.google-apps.folder",
+                "parents": [parent_id]}
+        return self._service.files().create(
+            body=body,
+            fields=FILE_FIELDS,
+            **self._write_kw,
+        )
+
+    def _rename_request(self, file_id: str, new_name: str) -> Any:
+        body = {"name": new_name}
+        return self._service.files().update(
+            fileId=file_id,
+            body=body,
+            fields=FILE_FIELDS,
+            **self._write_kw,
+        )
+
+    def _move_request(
+        self,
+        file_id: str,
+        new_parent_id: str,
+        old_parents: Sequence[str],
+    ) -> Any:
+        remove_parents = ",".join(old_parents) if old_parents else ""
+        return self._service.files().update(
+            fileId=file_id,
+            addParents=new_parent_id,
+            removeParents=remove_parents or None,
+            fields=FILE_FIELDS,
+            **self._write_kw,
+        )
 
-    def _common_list_kwargs(self) -> dict[str, Any]:
-        if not self._supports_all_drives:
-            return {}
-        return {"supportsAllDrives": True, "includeItemsFromAllDrives": True}
+    def _copy_request(
+        self,
+        file_id: str,
+        new_parent_id: str,
+        new_name: Optional[str] = None,
+    ) -> Any:
+        body: dict[str, Any] = {"parents": [new_parent_id]}
+        if new_name is not None:
+            body["name"] = new_name
 
-    def _common_write_kwargs(self) -> dict[str, Any]:
-        if not self._supports_all_drives:
-            return {}
-        return {"supportsAllDrives": True}
+        return self._service.files().copy(
+            fileId=file_id,
+            body=body,
+            fields=FILE_FIELDS,
+            **self._write_kw,
+        )
+
+    def _trash_request(self, file_id: str) -> Any:
+        body = {"trashed": True}
+        return self._service.files().update(
+            fileId=file_id,
+            body=body,
+            fields="id",
+            **self._write_kw,
+        )
+
+    def _delete_permanently_request(self, file_id: str) -> Any:
+        return self._service.files().delete(
+            fileId=file_id,
+            **self._write_kw,
+        )
 
     def _list_children_raw(
         self,
@@ -332,26 +594,139 @@ class GoogleDriveController:
         return self._find_by_query(q)
 
     def _find_by_query(self, q: str) -> list[FileInfo]:
-        all_files: list[FileInfo] = []
+        return list(self._iter_query(q))
+
+    def _iter_query(self, q: str) -> Iterator[FileInfo]:
+        """Yield matching files page by page; the next page is fetched lazily."""
         page_token: Optional[str] = None
 
         while True:
             req = self._service.files().list(
                 q=q,
                 fields=LIST_FIELDS,
+                pageSize=_LIST_PAGE_SIZE,
                 pageToken=page_token,
-                **self._common_list_kwargs(),
+                **self._list_kw,
             )
             data = self._execute(req.execute)
-            files = data.get("files", [])
-            for f in files:
-                all_files.append(_file_dict_to_file_info(f))
+            for f in data.get("files", []):
+                yield _file_dict_to_file_info(f)
 
             page_token = data.get("nextPageToken")
             if not page_token:
                 break
 
-        return all_files
+    def _list_children_batch(
+        self,
+        parent_ids: Sequence[str],
+        *,
+        include_trashed: bool,
+        fields: str = LIST_FIELDS,
+    ) -> dict[str, list[FileInfo]]:
+        """List children of many parents, following pagination per parent."""
+        children: dict[str, list[FileInfo]] = {pid: [] for pid in parent_ids}
+        page_tokens: dict[str, Optional[str]] = dict.fromkeys(parent_ids)
+
+        while page_tokens:
+            requests = [
+                (
+                    parent_id,
+                    self._service.files().list(
+                        q=_build_parent_query(parent_id, include_trashed=include_trashed),
+                        fields=fields,
+                        pageSize=_LIST_PAGE_SIZE,
+                        pageToken=page_token,
+                        **self._list_kw,
+                    ),
+                )
+                for parent_id, page_token in page_tokens.items()
+            ]
+            responses = self._execute_batch(requests)
+
+            page_tokens = {}
+            for parent_id, data in responses.items():
+                for f in data.get("files", []):
+                    children[parent_id].append(_file_dict_to_file_info(f))
+                next_token = data.get("nextPageToken")
+                if next_token:
+                    page_tokens[parent_id] = next_token
+
+        return children
+
+    def _execute_batch(self, requests: Sequence[tuple[str, Any]]) -> dict[str, Any]:
+        """Like _execute_batch_outcomes, but raise the first failed call's error."""
+        outcomes = self._execute_batch_outcomes(requests)
+        for request_id, _ in requests:
+            outcome = outcomes[request_id]
+            if isinstance(outcome, GDriveMgrError):
+                raise outcome
+        return outcomes
+
+    def _execute_batch_outcomes(self, requests: Sequence[tuple[str, Any]]) -> dict[str, Any]:
+        """
+        Execute (request_id, request) pairs through Drive batch requests.
+
+        Returns:
+            request_id -> response, or the mapped gdrivemgr error of that call.
+
+        Notes:
+            - A single request is sent directly (no multipart overhead).
+            - When several batches are needed, they run on worker threads,
+              each with its own HTTP object.
+            - Sub-requests failing with a retryable error are re-sent one by
+              one under the retry policy.
+            - A failure of the batch HTTP call itself is raised.
+        """
+        if len(requests) == 1:
+            request_id, req = requests[0]
+            try:
+                return {request_id: self._execute(req.execute)}
+            except GDriveMgrError as exc:
+                return {request_id: exc}
+
+        responses: dict[str, Any] = {}
+        errors: dict[str, Exception] = {}
+
+        def _callback(request_id: str, response: Any, exception: Optional[Exception]) -> None:
+            if exception is not None:
+                errors[request_id] = exception
+            else:
+                responses[request_id] = response
+
+        batches = []
+        for start in range(0, len(requests), _BATCH_MAX_REQUESTS):
+            batch = self._service.new_batch_http_request(callback=_callback)
+            for request_id, req in requests[start:start + _BATCH_MAX_REQUESTS]:
+                batch.add(req, request_id=request_id)
+            batches.append(batch)
+
+        if len(batches) > 1 and self._can_run_parallel():
+            executor = self._get_executor()
+            futures = [
+                executor.submit(self._execute_on_thread_http, batch.execute)
+                for batch in batches
+            ]
+            for future in futures:
+                future.result()
+        else:
+            for batch in batches:
+                self._execute(batch.execute)
+
+        for request_id, req in requests:
+            exc = errors.pop(request_id, None)
+            if exc is None:
+                continue
+            mapped = self._map_exception(exc)
+            if not self._should_retry(mapped):
+                mapped.__cause__ = exc
+                responses[request_id] = mapped
+                continue
+            try:
+                responses[request_id] = self._execute(req.execute)
+            except GDriveMgrError as retry_exc:
+                responses[request_id] = retry_exc
+
+        return responses
 
     def _execute(self, func: Callable[[], T]) -> T:
         delay = self._retry_policy.initial_delay_sec
@@ -361,7 +736,10 @@ class GoogleDriveController:
             except Exception as exc:
                 mapped = self._map_exception(exc)
                 if self._should_retry(mapped) and attempt < self._retry_policy.max_retries:
-                    time.sleep(delay)
+                    # Jitter spreads out retries from parallel workers; never
+                    # wait less than the server asked for via Retry-After.
+                    retry_after = (getattr(mapped, "details", None) or {}).get("retry_after")
+                    time.sleep(max(retry_after or 0, delay * random.uniform(0.5, 1.5)))
                     delay *= 2
                     continue
                 raise mapped from exc
@@ -394,6 +772,13 @@ class GoogleDriveController:
         return ApiError("Drive API error", cause=exc)
 
 
+def _with_http(req: Any, http: Any) -> Any:
+    """Bind req to http (a worker thread's own HTTP object) when given."""
+    if http is not None:
+        req.http = http
+    return req
+
+
 def _build_parent_query(parent_id: str, *, include_trashed: bool) -> str:
     q = f"'{parent_id}' in parents"
     if not include_trashed:
@@ -402,62 +787,52 @@ def _build_parent_query(parent_id: str, *, include_trashed: bool) -> str:
 
 
 def _file_dict_to_file_info(data: dict[str, Any]) -> FileInfo:
-    file_id = data.get("id")
-    name = data.get("name", "")
-    mime_type = data.get("mimeType", "")
-    parents = data.get("parents", []) or []
-    trashed = bool(data.get("trashed", False))
+    # Field types are fixed by the ``fields=`` selector, so values are used as-is.
+    g = data.get
+    file_id = g("id")
 
-    modified_time = None
-    created_time = None
-
-    if isinstance(data.get("modifiedTime"), str):
-        try:
-            modified_time = parse_rfc3339(data["modifiedTime"])
-        except ValueError:
-            modified_time = None
-
-    if isinstance(data.get("createdTime"), str):
-        try:
-            created_time = parse_rfc3339(data["createdTime"])
-        except ValueError:
-            created_time = None
-
-    size = None
-    if isinstance(data.get("size"), str) and data["size"].isdigit():
+    try:
         size = int(data["size"])
-    elif isinstance(data.get("size"), int):
-        size = data["size"]
-
-    md5 = data.get("md5Checksum")
-    md5_checksum = md5 if isinstance(md5, str) else None
+    except (KeyError, TypeError, ValueError):
+        size = None
 
-    local_id = file_id if isinstance(file_id, str) else ""
     return FileInfo(
-        local_id=local_id,
-        file_id=file_id if isinstance(file_id, str) else None,
-        name=name if isinstance(name, str) else "",
-        mime_type=mime_type if isinstance(mime_type, str) else "",
-        parents=list(parents) if isinstance(parents, list) else [],
-        trashed=trashed,
-        modified_time=modified_time,
-        created_time=created_time,
+        local_id=file_id or "",
+        file_id=file_id,
+        name=g("name") or "",
+        mime_type=g("mimeType") or "",
+        parents=g("parents") or [],
+        trashed=bool(g("trashed")),
+        modified_time=_maybe_rfc3339(g("modifiedTime")),
+        created_time=_maybe_rfc3339(g("createdTime")),
         size=size,
-        md5_checksum=md5_checksum,
+        md5_checksum=g("md5Checksum"),
     )
 
 
+def _maybe_rfc3339(value: Any) -> Optional[datetime]:
+    try:
+        return parse_rfc3339(value) if value else None
+    except (TypeError, ValueError):
+        return None
+
+
 def _http_error_to_info(exc: Any) -> HttpErrorInfo:
-    status_code = getattr(getattr(exc, "resp", None), "status", None)
-    reason = getattr(getattr(exc, "resp", None), "reason", None)
+    resp = getattr(exc, "resp", None)
+    status_code = getattr(resp, "status", None)
+    reason = getattr(resp, "reason", None)
 
     message = None
     details: dict[str, Any] = {}
 
+    retry_after = _parse_retry_after(resp)
+    if retry_after is not None:
+        details["retry_after"] = retry_after
+
     content = getattr(exc, "content", None)
     if isinstance(content, (bytes, bytearray)):
         try:
-            payload = json.loads(content.decode("utf-8"))
+            payload = _json.loads(content)
             err = payload.get("error", {})
             message = err.get("message") or None
             errors = err.get("errors") or []
@@ -478,3 +853,15 @@ def _http_error_to_info(exc: Any) -> HttpErrorInfo:
         message=message,
         details=details or None,
     )
+
+
+def _parse_retry_after(resp: Any) -> Optional[float]:
+    # Only the delta-seconds form is honored; HTTP-date values are ignored.
+    if not isinstance(resp, dict):
+        return None
+    value = resp.get("retry-after")
+    if isinstance(value, int):
+        return float(value)
+    if isinstance(value, str) and value.strip().isdigit():
+        return float(value.strip())
+    return None
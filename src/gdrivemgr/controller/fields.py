@@ -2,16 +2,30 @@
 
 from __future__ import annotations
 
-FILE_FIELDS: str = (
-    "id,"
-    "name,"
-    "mimeType,"
-    "parents,"
-    "trashed,"
-    "modifiedTime,"
-    "createdTime,"
-    "size,"
-    "md5Checksum"
+FILE_FIELD_NAMES: tuple[str, ...] = (
+    "id",
+    "name",
+    "mimeType",
+    "parents",
+    "trashed",
+    "modifiedTime",
+    "createdTime",
+    "size",
+    "md5Checksum",
 )
 
+# Subset for tree scans: structure plus modifiedTime (needed for preconditions).
+TREE_FIELD_NAMES: tuple[str, ...] = (
+    "id",
+    "name",
+    "mimeType",
+    "parents",
+    "trashed",
+    "modifiedTime",
+)
+
+FILE_FIELDS: str = ",".join(FILE_FIELD_NAMES)
+FILE_FIELDS_TREE: str = ",".join(TREE_FIELD_NAMES)
+
 LIST_FIELDS: str = f"nextPageToken,files({FILE_FIELDS})"
+LIST_FIELDS_TREE: str = f"nextPageToken,files({FILE_FIELDS_TREE})"
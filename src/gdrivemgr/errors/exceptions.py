@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass
 from typing import Any, Optional
 
@@ -90,11 +91,16 @@ _QUOTA_REASON_KEYWORDS: tuple[str, ...] = (
     "storageQuotaExceeded",
 )
 
+# Case-insensitive substring match over all keywords in a single scan.
+_QUOTA_REASON_RE = re.compile(
+    "|".join(re.escape(key.lower()) for key in _QUOTA_REASON_KEYWORDS)
+)
+
 
 def _is_quota_reason(reason: str | None) -> bool:
     if not reason:
         return False
-    return any(key.lower() in reason.lower() for key in _QUOTA_REASON_KEYWORDS)
+    return _QUOTA_REASON_RE.search(reason.lower()) is not None
 
 
 def map_http_error(
@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import copy
 import os
-from collections import deque
 from datetime import datetime
-from typing import Optional
+from operator import attrgetter
+from typing import Iterable, Optional
 
 from gdrivemgr.errors import LocalValidationError
 from gdrivemgr.models import FileInfo
@@ -18,7 +17,7 @@ from gdrivemgr.plan import (
     build_apply_order,
 )
 from gdrivemgr.util.ids import new_local_id, new_op_id, new_plan_id
-from gdrivemgr.util.mime import FOLDER_MIME, is_folder
+from gdrivemgr.util.mime import FOLDER_MIME
 from gdrivemgr.util.time import now_utc
 
 from .snapshot import DriveSnapshot
@@ -31,6 +30,8 @@ from .validators import (
     validate_not_tombstoned,
 )
 
+_NAME_ID_KEY = attrgetter("name", "local_id")
+
 
 class GoogleDriveLocal:
     """
@@ -43,16 +44,18 @@ class GoogleDriveLocal:
 
     def __init__(self, root_local_id: str, snapshot: DriveSnapshot) -> None:
         self.root_local_id = root_local_id
+        # Both clones are copy-on-write: only touched nodes are ever copied.
         self._base_snapshot = snapshot.clone()
-        self._snapshot = snapshot.clone()
+        self._snapshot = self._base_snapshot.clone()
         self._ops: list[PlanOperation] = []
+        self._seq_counter = 0
         self._tombstoned: set[str] = set()
 
     @classmethod
     def from_file_infos(
         cls,
         root_local_id: str,
-        file_infos: list[FileInfo],
+        file_infos: Iterable[FileInfo],
     ) -> GoogleDriveLocal:
         snap = DriveSnapshot.from_file_infos(file_infos)
         return cls(root_local_id=root_local_id, snapshot=snap)
@@ -61,8 +64,7 @@ class GoogleDriveLocal:
     # Read APIs
     # ----------------------------
     def get(self, local_id: str) -> FileInfo:
-        validate_exists(self._snapshot, local_id, "Item")
-        return self._snapshot.get(local_id)
+        return validate_exists(self._snapshot, local_id, "Item")
 
     def find_by_file_id(self, file_id: str) -> Optional[FileInfo]:
         """
@@ -72,20 +74,18 @@ class GoogleDriveLocal:
             - Return only if the file_id is within the snapshot scope.
             - Do NOT fetch from Drive (no controller access).
         """
-        if not self._snapshot.has(file_id):
-            return None
-        info = self._snapshot.get(file_id)
-        if info.file_id == file_id or info.local_id == file_id:
-            return info
-        return None
+        # Existing Drive items are keyed by local_id == file_id, so this is a
+        # single lookup (the former file_id/local_id re-check always held).
+        return self._snapshot.files_by_local_id.get(file_id)
 
     def list_children(self, parent_local_id: str) -> list[FileInfo]:
-        validate_exists(self._snapshot, parent_local_id, "Parent")
-        validate_is_folder(self._snapshot, parent_local_id, "Parent")
+        parent = validate_exists(self._snapshot, parent_local_id, "Parent")
+        validate_is_folder(parent, "Parent")
 
-        ids = self._snapshot.list_children_ids(parent_local_id)
-        infos = [self._snapshot.get(cid) for cid in ids]
-        infos.sort(key=lambda x: (x.name, x.local_id))
+        files = self._snapshot.files_by_local_id
+        children = self._snapshot.children_by_parent_local_id.get(parent_local_id, ())
+        infos = [files[cid] for cid in children]
+        infos.sort(key=_NAME_ID_KEY)
         return infos
 
     def find_by_name(self, name: str, parent_local_id: Optional[str] = None) -> list[FileInfo]:
@@ -99,34 +99,15 @@ class GoogleDriveLocal:
         if parent_local_id is not None:
             validate_exists(self._snapshot, parent_local_id, "Parent")
             name_map = self._snapshot.name_index_by_parent_local_id.get(parent_local_id, {})
-            ids = name_map.get(name, [])
+            ids = name_map.get(name, ())
             return [self._snapshot.get(cid) for cid in ids]
 
-        # Whole scope: traverse from root to avoid accidental inclusion of
-        # unreachable nodes (shouldn't happen, but safe).
-        matches: list[FileInfo] = []
-        visited: set[str] = set()
-        q: deque[str] = deque([self.root_local_id])
-
-        while q:
-            cur = q.popleft()
-            if cur in visited:
-                continue
-            visited.add(cur)
-
-            if not self._snapshot.has(cur):
-                continue
-
-            info = self._snapshot.get(cur)
-            if info.name == name:
-                matches.append(info)
-
-            for child_id in self._snapshot.children_by_parent_local_id.get(cur, set()):
-                if child_id not in visited:
-                    q.append(child_id)
-
-        matches.sort(key=lambda x: (x.name, x.local_id))
-        return matches
+        # Whole scope: global name index, restricted to nodes reachable from
+        # root (the depth map holds exactly those).
+        depth = self._compute_depths()
+        ids = [i for i in self._snapshot.name_index_global.get(name, ()) if i in depth]
+        ids.sort()
+        return [self._snapshot.get(i) for i in ids]
 
     def list_ops(self) -> list[PlanOperation]:
         return list(self._ops)
@@ -137,12 +118,13 @@ class GoogleDriveLocal:
     def clear_ops(self) -> None:
         """Clear pending operations and reset virtual state to the base snapshot."""
         self._ops.clear()
+        self._seq_counter = 0
         self._tombstoned.clear()
         self._snapshot = self._base_snapshot.clone()
 
     def create_folder(self, name: str, parent_local_id: str) -> str:
-        validate_exists(self._snapshot, parent_local_id, "Parent")
-        validate_is_folder(self._snapshot, parent_local_id, "Parent")
+        parent = validate_exists(self._snapshot, parent_local_id, "Parent")
+        validate_is_folder(parent, "Parent")
         validate_not_tombstoned(self._tombstoned, parent_local_id, "Parent")
 
         new_id = new_local_id()
@@ -185,15 +167,15 @@ class GoogleDriveLocal:
         self._ops.append(op)
 
     def move(self, target_local_id: str, new_parent_local_id: str) -> None:
-        validate_exists(self._snapshot, target_local_id, "Target")
-        validate_exists(self._snapshot, new_parent_local_id, "New parent")
-        validate_is_folder(self._snapshot, new_parent_local_id, "New parent")
+        target = validate_exists(self._snapshot, target_local_id, "Target")
+        new_parent = validate_exists(self._snapshot, new_parent_local_id, "New parent")
+        validate_is_folder(new_parent, "New parent")
 
         validate_not_root(self.root_local_id, target_local_id, "MOVE")
         validate_not_tombstoned(self._tombstoned, target_local_id, "Target")
         validate_not_tombstoned(self._tombstoned, new_parent_local_id, "New parent")
 
-        validate_move_single_parent(self._snapshot, target_local_id)
+        validate_move_single_parent(target)
         validate_move_no_cycle(self._snapshot, target_local_id, new_parent_local_id)
 
         self._snapshot.replace_parent(target_local_id, new_parent_local_id)
@@ -214,15 +196,14 @@ class GoogleDriveLocal:
         new_parent_local_id: str,
         new_name: Optional[str] = None,
     ) -> str:
-        validate_exists(self._snapshot, target_local_id, "Target")
-        validate_exists(self._snapshot, new_parent_local_id, "New parent")
-        validate_is_folder(self._snapshot, new_parent_local_id, "New parent")
+        src = validate_exists(self._snapshot, target_local_id, "Target")
+        new_parent = validate_exists(self._snapshot, new_parent_local_id, "New parent")
+        validate_is_folder(new_parent, "New parent")
 
         validate_not_tombstoned(self._tombstoned, target_local_id, "Target")
         validate_not_tombstoned(self._tombstoned, new_parent_local_id, "New parent")
 
-        src = self._snapshot.get(target_local_id)
-        if is_folder(src.mime_type):
+        if src.is_folder:
             raise LocalValidationError("Folder COPY is not supported in v1")
 
         copy_name = new_name if new_name is not None else src.name
@@ -255,7 +236,7 @@ class GoogleDriveLocal:
         validate_not_tombstoned(self._tombstoned, target_local_id, "Target")
 
         self._tombstoned.add(target_local_id)
-        self._snapshot.get(target_local_id).trashed = True
+        self._snapshot.set_trashed(target_local_id)
 
         op = PlanOperation(
             op_id=new_op_id(),
@@ -272,7 +253,7 @@ class GoogleDriveLocal:
         validate_not_tombstoned(self._tombstoned, target_local_id, "Target")
 
         self._tombstoned.add(target_local_id)
-        self._snapshot.get(target_local_id).trashed = True
+        self._snapshot.set_trashed(target_local_id)
 
         op = PlanOperation(
             op_id=new_op_id(),
@@ -289,8 +270,8 @@ class GoogleDriveLocal:
         parent_local_id: str,
         name: Optional[str] = None,
     ) -> str:
-        validate_exists(self._snapshot, parent_local_id, "Parent")
-        validate_is_folder(self._snapshot, parent_local_id, "Parent")
+        parent = validate_exists(self._snapshot, parent_local_id, "Parent")
+        validate_is_folder(parent, "Parent")
         validate_not_tombstoned(self._tombstoned, parent_local_id, "Parent")
 
         file_name = name if name is not None else os.path.basename(local_path)
@@ -350,7 +331,9 @@ class GoogleDriveLocal:
             - apply_order (delete blocks deep->shallow if depths available)
             - default modified_time preconditions (v1)
         """
-        ops_copy: list[PlanOperation] = copy.deepcopy(self._ops)
+        # _ops is appended in increasing seq order, so no sort is needed.
+        ops_copy: list[PlanOperation] = [op.clone() for op in self._ops]
+        assert all(a.seq < b.seq for a, b in zip(ops_copy, ops_copy[1:]))
 
         # Attach modified_time preconditions (in-place on copied ops).
         apply_default_preconditions(ops_copy, self._snapshot.files_by_local_id)
@@ -362,7 +345,7 @@ class GoogleDriveLocal:
             plan_id=new_plan_id(),
             remote_root_id=self.root_local_id,
             created_at=now_utc(),
-            operations=sorted(ops_copy, key=lambda o: o.seq),
+            operations=ops_copy,
             apply_order=apply_order,
         )
 
@@ -370,29 +353,10 @@ class GoogleDriveLocal:
     # Internals
     # ----------------------------
     def _next_seq(self) -> int:
-        return len(self._ops)
+        seq = self._seq_counter
+        self._seq_counter += 1
+        return seq
 
     def _compute_depths(self) -> dict[str, int]:
-        """
-        Compute shortest depth (root -> node) within current snapshot.
-
-        Spec decision:
-            Depth is the minimum distance from root (BFS).
-        """
-        if not self._snapshot.has(self.root_local_id):
-            return {}
-
-        depth: dict[str, int] = {self.root_local_id: 0}
-        q: deque[str] = deque([self.root_local_id])
-
-        while q:
-            cur = q.popleft()
-            cur_depth = depth[cur]
-            for child_id in self._snapshot.children_by_parent_local_id.get(cur, set()):
-                if child_id not in self._snapshot.files_by_local_id:
-                    continue
-                if child_id not in depth:
-                    depth[child_id] = cur_depth + 1
-                    q.append(child_id)
-
-        return depth
+        """Shortest depth (root -> node); cached and maintained by the snapshot."""
+        return self._snapshot.depth_map(self.root_local_id)
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import DefaultDict
+from typing import DefaultDict, Iterable, Optional
 
 from gdrivemgr.models import FileInfo
 
@@ -17,18 +17,44 @@ class DriveSnapshot:
         - files_by_local_id
         - children_by_parent_local_id
         - name_index_by_parent_local_id
+        - name_index_global (name -> local_ids, regardless of parent)
+
+    Copy-on-write:
+        clone() copies only the top-level index dicts. FileInfo objects and
+        per-parent containers stay shared until one side writes to them;
+        the _owned_* sets track which of them this snapshot may mutate.
+
+    Depth cache:
+        depth_map() memoizes root depths. Structural mutations bump
+        ``generation`` and patch the cached map in place when that is cheap;
+        otherwise the map is recomputed on the next call.
     """
 
     files_by_local_id: dict[str, FileInfo] = field(default_factory=dict)
-    children_by_parent_local_id: dict[str, set[str]] = field(default_factory=dict)
-    name_index_by_parent_local_id: dict[str, dict[str, list[str]]] = field(
+    # Children are insertion-ordered dict keys (values are always None).
+    children_by_parent_local_id: dict[str, dict[str, None]] = field(default_factory=dict)
+    # name -> insertion-ordered ids (dict keys; values are always None).
+    name_index_by_parent_local_id: dict[str, dict[str, dict[str, None]]] = field(
         default_factory=dict
     )
+    name_index_global: dict[str, set[str]] = field(default_factory=dict)
+
+    _owned_files: set[str] = field(default_factory=set, init=False, repr=False)
+    _owned_children: set[str] = field(default_factory=set, init=False, repr=False)
+    _owned_names: set[str] = field(default_factory=set, init=False, repr=False)
+    _owned_global_names: set[str] = field(default_factory=set, init=False, repr=False)
+
+    generation: int = field(default=0, init=False)
+    _depth_root: Optional[str] = field(default=None, init=False, repr=False)
+    _depth_by_local_id: Optional[dict[str, int]] = field(
+        default=None, init=False, repr=False
+    )
+    _depth_generation: int = field(default=-1, init=False, repr=False)
 
     @classmethod
-    def from_file_infos(cls, files: list[FileInfo]) -> DriveSnapshot:
+    def from_file_infos(cls, files: Iterable[FileInfo]) -> DriveSnapshot:
         """
-        Build snapshot from a list of FileInfo.
+        Build snapshot from FileInfo items (consumed in a single pass).
 
         Notes:
             - parents are expected to be local_ids within the same scope (for
@@ -40,36 +66,29 @@ class DriveSnapshot:
         return snap
 
     def clone(self) -> DriveSnapshot:
-        """Deep-clone this snapshot (including indexes)."""
-        # Clone FileInfo objects (to avoid mutating the base snapshot).
-        new_files: dict[str, FileInfo] = {}
-        for local_id, info in self.files_by_local_id.items():
-            new_files[local_id] = FileInfo(
-                local_id=info.local_id,
-                file_id=info.file_id,
-                name=info.name,
-                mime_type=info.mime_type,
-                parents=list(info.parents),
-                trashed=info.trashed,
-                modified_time=info.modified_time,
-                created_time=info.created_time,
-                size=info.size,
-                md5_checksum=info.md5_checksum,
-            )
-
-        new_children: dict[str, set[str]] = {
-            parent: set(children) for parent, children in self.children_by_parent_local_id.items()
-        }
-
-        new_name_index: dict[str, dict[str, list[str]]] = {}
-        for parent, name_map in self.name_index_by_parent_local_id.items():
-            new_name_index[parent] = {name: list(ids) for name, ids in name_map.items()}
-
-        return DriveSnapshot(
-            files_by_local_id=new_files,
-            children_by_parent_local_id=new_children,
-            name_index_by_parent_local_id=new_name_index,
+        """
+        Clone this snapshot (copy-on-write).
+
+        Mutations on either snapshot never affect the other one.
+        """
+        # Everything is shared from now on, so neither side owns anything.
+        self._owned_files.clear()
+        self._owned_children.clear()
+        self._owned_names.clear()
+        self._owned_global_names.clear()
+
+        snap = DriveSnapshot(
+            files_by_local_id=dict(self.files_by_local_id),
+            children_by_parent_local_id=dict(self.children_by_parent_local_id),
+            name_index_by_parent_local_id=dict(self.name_index_by_parent_local_id),
+            name_index_global=dict(self.name_index_global),
         )
+        snap.generation = self.generation
+        if self._depth_fresh():
+            snap._depth_root = self._depth_root
+            snap._depth_by_local_id = dict(self._depth_by_local_id)  # type: ignore[arg-type]
+            snap._depth_generation = self.generation
+        return snap
 
     # ----------------------------
     # Query helpers
@@ -81,7 +100,19 @@ class DriveSnapshot:
         return self.files_by_local_id[local_id]
 
     def list_children_ids(self, parent_local_id: str) -> list[str]:
-        return list(self.children_by_parent_local_id.get(parent_local_id, set()))
+        return list(self.children_by_parent_local_id.get(parent_local_id, ()))
+
+    def depth_map(self, root_local_id: str) -> dict[str, int]:
+        """
+        Return shortest depth (root -> node) for every reachable node.
+
+        The returned dict is owned by the snapshot; callers must not mutate it.
+        """
+        if self._depth_root != root_local_id or not self._depth_fresh():
+            self._depth_by_local_id = self._compute_depths(root_local_id)
+            self._depth_root = root_local_id
+            self._depth_generation = self.generation
+        return self._depth_by_local_id  # type: ignore[return-value]
 
     # ----------------------------
     # Mutation helpers (keep indexes consistent)
@@ -96,8 +127,16 @@ class DriveSnapshot:
         if not info:
             return
 
+        fresh = self._bump_generation()
+        if fresh and not self.children_by_parent_local_id.get(local_id):
+            # A leaf: no other depth changes.
+            self._depth_by_local_id.pop(local_id, None)  # type: ignore[union-attr]
+            self._depth_generation = self.generation
+
         self._detach_from_parents(info)
+        self._remove_global_name(info.name, local_id)
         self.files_by_local_id.pop(local_id, None)
+        self._owned_files.discard(local_id)
 
         # Remove children index entry (children become unreachable but remain).
         self.children_by_parent_local_id.pop(local_id, None)
@@ -114,8 +153,10 @@ class DriveSnapshot:
         for parent in info.parents:
             self._remove_name_index(parent, old_name, local_id)
             self._add_name_index(parent, new_name, local_id)
+        self._remove_global_name(old_name, local_id)
+        self._own_global_names(new_name).add(local_id)
 
-        info.name = new_name
+        self._own_file(local_id).name = new_name
 
     def replace_parent(self, local_id: str, new_parent_local_id: str) -> None:
         """
@@ -125,55 +166,235 @@ class DriveSnapshot:
             Multiple-parents behavior is handled by validators. This method
             implements the move semantics (parent replacement) only.
         """
-        info = self.files_by_local_id[local_id]
-        old_parents = list(info.parents)
-
-        for parent in old_parents:
-            self._remove_child_index(parent, info.name, local_id)
+        info = self._own_file(local_id)
+        # parents is rebound below (not mutated), so no defensive copy needed.
+        self._detach_from_parents(info)
 
         info.parents = [new_parent_local_id]
         self._add_child_index(new_parent_local_id, info.name, local_id)
 
+        if self._bump_generation():
+            self._redepth_subtree(local_id, new_parent_local_id)
+
+    def set_trashed(self, local_id: str, trashed: bool = True) -> None:
+        """Set the trashed flag of a file."""
+        if self.files_by_local_id[local_id].trashed != trashed:
+            self._own_file(local_id).trashed = trashed
+
     # ----------------------------
     # Internal index maintenance
     # ----------------------------
+    def _own_file(self, local_id: str) -> FileInfo:
+        """Return a FileInfo this snapshot may mutate (copied on first write)."""
+        info = self.files_by_local_id[local_id]
+        if local_id not in self._owned_files:
+            info = _copy_file_info(info)
+            self.files_by_local_id[local_id] = info
+            self._owned_files.add(local_id)
+        return info
+
+    def _own_children(self, parent: str) -> dict[str, None]:
+        children = self.children_by_parent_local_id.get(parent)
+        if children is None:
+            children = {}
+        elif parent in self._owned_children:
+            return children
+        else:
+            children = children.copy()
+        self.children_by_parent_local_id[parent] = children
+        self._owned_children.add(parent)
+        return children
+
+    def _own_name_map(self, parent: str) -> dict[str, dict[str, None]]:
+        name_map = self.name_index_by_parent_local_id.get(parent)
+        if name_map is None:
+            name_map = {}
+        elif parent in self._owned_names:
+            return name_map
+        else:
+            name_map = {name: ids.copy() for name, ids in name_map.items()}
+        self.name_index_by_parent_local_id[parent] = name_map
+        self._owned_names.add(parent)
+        return name_map
+
+    def _own_global_names(self, name: str) -> set[str]:
+        ids = self.name_index_global.get(name)
+        if ids is None:
+            ids = set()
+        elif name in self._owned_global_names:
+            return ids
+        else:
+            ids = set(ids)
+        self.name_index_global[name] = ids
+        self._owned_global_names.add(name)
+        return ids
+
+    def _remove_global_name(self, name: str, local_id: str) -> None:
+        if local_id not in self.name_index_global.get(name, ()):
+            return
+        ids = self._own_global_names(name)
+        ids.discard(local_id)
+        if not ids:
+            del self.name_index_global[name]
+            self._owned_global_names.discard(name)
+
     def _insert_file(self, info: FileInfo) -> None:
+        if self._bump_generation():
+            self._depth_on_insert(info)
+
+        old = self.files_by_local_id.get(info.local_id)
+        if old is not None and old.name != info.name:
+            self._remove_global_name(old.name, info.local_id)
         self.files_by_local_id[info.local_id] = info
+        self._own_global_names(info.name).add(info.local_id)
 
         # Ensure empty containers exist.
-        self.children_by_parent_local_id.setdefault(info.local_id, set())
-        self.name_index_by_parent_local_id.setdefault(info.local_id, {})
-
-        for parent in info.parents:
+        if info.local_id not in self.children_by_parent_local_id:
+            self._own_children(info.local_id)
+        if info.local_id not in self.name_index_by_parent_local_id:
+            self._own_name_map(info.local_id)
+
+        parents = info.parents
+        if len(parents) == 1:  # common case: skip loop setup
+            self._add_child_index(parents[0], info.name, info.local_id)
+            return
+        for parent in parents:
             self._add_child_index(parent, info.name, info.local_id)
 
     def _detach_from_parents(self, info: FileInfo) -> None:
-        for parent in info.parents:
+        parents = info.parents
+        if len(parents) == 1:
+            self._remove_child_index(parents[0], info.name, info.local_id)
+            return
+        for parent in parents:
             self._remove_child_index(parent, info.name, info.local_id)
 
     def _add_child_index(self, parent: str, name: str, child: str) -> None:
-        self.children_by_parent_local_id.setdefault(parent, set()).add(child)
+        self._own_children(parent)[child] = None
         self._add_name_index(parent, name, child)
 
     def _remove_child_index(self, parent: str, name: str, child: str) -> None:
-        if parent in self.children_by_parent_local_id:
-            self.children_by_parent_local_id[parent].discard(child)
+        if child in self.children_by_parent_local_id.get(parent, ()):
+            del self._own_children(parent)[child]
         self._remove_name_index(parent, name, child)
 
     def _add_name_index(self, parent: str, name: str, child: str) -> None:
-        parent_map = self.name_index_by_parent_local_id.setdefault(parent, {})
-        ids = parent_map.setdefault(name, [])
-        if child not in ids:
-            ids.append(child)
+        self._own_name_map(parent).setdefault(name, {})[child] = None
 
     def _remove_name_index(self, parent: str, name: str, child: str) -> None:
         parent_map = self.name_index_by_parent_local_id.get(parent)
         if not parent_map:
             return
         ids = parent_map.get(name)
-        if not ids:
+        if not ids or child not in ids:
             return
-        if child in ids:
-            ids.remove(child)
+        parent_map = self._own_name_map(parent)
+        ids = parent_map[name]
+        del ids[child]
         if not ids:
             parent_map.pop(name, None)
+
+    # ----------------------------
+    # Depth cache maintenance
+    # ----------------------------
+    def _depth_fresh(self) -> bool:
+        return (
+            self._depth_by_local_id is not None
+            and self._depth_generation == self.generation
+        )
+
+    def _bump_generation(self) -> bool:
+        """Bump generation; return True if the depth cache was fresh before."""
+        fresh = self._depth_fresh()
+        self.generation += 1
+        return fresh
+
+    def _depth_on_insert(self, info: FileInfo) -> None:
+        depth = self._depth_by_local_id
+        assert depth is not None
+        local_id = info.local_id
+        if local_id in depth or self.children_by_parent_local_id.get(local_id):
+            return  # replaces a node or adopts children: recompute lazily
+
+        parent_depths = [depth[p] for p in info.parents if p in depth]
+        if parent_depths:
+            depth[local_id] = min(parent_depths) + 1
+        self._depth_generation = self.generation
+
+    def _redepth_subtree(self, local_id: str, new_parent_local_id: str) -> None:
+        """Update depths after local_id was moved under new_parent_local_id."""
+        depth = self._depth_by_local_id
+        assert depth is not None
+
+        # Collect the subtree; a node with another parent may keep a shorter
+        # path from outside the subtree, so fall back to a full recompute.
+        subtree = [local_id]
+        seen = {local_id}
+        i = 0
+        while i < len(subtree):
+            cur = subtree[i]
+            i += 1
+            for child_id in self.children_by_parent_local_id.get(cur, ()):
+                child = self.files_by_local_id.get(child_id)
+                if child is None or child_id in seen:
+                    continue
+                if len(child.parents) != 1:
+                    return
+                seen.add(child_id)
+                subtree.append(child_id)
+
+        parent_depth = depth.get(new_parent_local_id)
+        if parent_depth is None:
+            for node in subtree:
+                depth.pop(node, None)
+        else:
+            depth[local_id] = parent_depth + 1
+            for node in subtree[1:]:
+                depth[node] = depth[self.files_by_local_id[node].parents[0]] + 1
+        self._depth_generation = self.generation
+
+    def _compute_depths(self, root_local_id: str) -> dict[str, int]:
+        """
+        Compute shortest depth (root -> node) within this snapshot.
+
+        Spec decision:
+            Depth is the minimum distance from root (BFS).
+        """
+        if root_local_id not in self.files_by_local_id:
+            return {}
+
+        files = self.files_by_local_id
+        children_by_parent = self.children_by_parent_local_id
+        depth: dict[str, int] = {root_local_id: 0}
+        # List + read cursor instead of deque.popleft().
+        q: list[str] = [root_local_id]
+        i = 0
+
+        while i < len(q):
+            cur = q[i]
+            i += 1
+            cur_depth = depth[cur] + 1
+            for child_id in children_by_parent.get(cur, ()):
+                if child_id not in depth and child_id in files:
+                    depth[child_id] = cur_depth
+                    q.append(child_id)
+
+        return depth
+
+
+def _copy_file_info(info: FileInfo, _new=object.__new__) -> FileInfo:
+    # Bypass __init__/__post_init__: plain slot stores are ~3x faster than the
+    # keyword constructor. Keep in sync with the FileInfo fields.
+    c = _new(FileInfo)
+    c.local_id = info.local_id
+    c.file_id = info.file_id
+    c.name = info.name
+    c.mime_type = info.mime_type
+    c.parents = info.parents[:]
+    c.trashed = info.trashed
+    c.modified_time = info.modified_time
+    c.created_time = info.created_time
+    c.size = info.size
+    c.md5_checksum = info.md5_checksum
+    c.is_folder = info.is_folder
+    return c
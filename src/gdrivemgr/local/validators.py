@@ -2,23 +2,23 @@
 
 from __future__ import annotations
 
-from collections import deque
-
 from gdrivemgr.errors import LocalValidationError
-from gdrivemgr.util.mime import is_folder
+from gdrivemgr.models import FileInfo
 
 from .snapshot import DriveSnapshot
 
 
-def validate_exists(snapshot: DriveSnapshot, local_id: str, what: str) -> None:
-    if not snapshot.has(local_id):
+def validate_exists(snapshot: DriveSnapshot, local_id: str, what: str) -> FileInfo:
+    """Return the item so follow-up checks can reuse it without a lookup."""
+    info = snapshot.files_by_local_id.get(local_id)
+    if info is None:
         raise LocalValidationError(f"{what} does not exist: {local_id}")
+    return info
 
 
-def validate_is_folder(snapshot: DriveSnapshot, local_id: str, what: str) -> None:
-    info = snapshot.get(local_id)
-    if not is_folder(info.mime_type):
-        raise LocalValidationError(f"{what} must be a folder: {local_id}")
+def validate_is_folder(info: FileInfo, what: str) -> None:
+    if not info.is_folder:
+        raise LocalValidationError(f"{what} must be a folder: {info.local_id}")
 
 
 def validate_not_root(root_local_id: str, target_local_id: str, action: str) -> None:
@@ -36,12 +36,11 @@ def validate_not_tombstoned(
                                    f"{target_local_id}")
 
 
-def validate_move_single_parent(snapshot: DriveSnapshot, target_local_id: str) -> None:
-    info = snapshot.get(target_local_id)
+def validate_move_single_parent(info: FileInfo) -> None:
     if len(info.parents) >= 2:
         raise LocalValidationError(
             "MOVE is not allowed for multi-parent items in v1: "
-            f"{target_local_id}"
+            f"{info.local_id}"
         )
 
 
@@ -60,23 +59,48 @@ def validate_move_no_cycle(
     if target_local_id == new_parent_local_id:
         raise LocalValidationError("MOVE would create a cycle (target == new_parent)")
 
-    q: deque[str] = deque([new_parent_local_id])
-    visited: set[str] = set()
+    files = snapshot.files_by_local_id
 
-    while q:
-        cur = q.popleft()
-        if cur in visited:
-            continue
-        visited.add(cur)
+    # Only folders can have descendants, so moving anything else never cycles.
+    target_info = files.get(target_local_id)
+    if target_info is not None and not target_info.is_folder:
+        return
+
+    # Fast path: follow single-parent links with a plain pointer chase. The
+    # step bound only guards against pre-existing cycles in the snapshot.
+    cur = new_parent_local_id
+    for _ in range(len(files) + 1):
+        if cur == target_local_id:
+            raise LocalValidationError("MOVE would create a cycle")
+
+        cur_info = files.get(cur)
+        if cur_info is None or not cur_info.parents:
+            # Parent outside of scope (or root); no cycle.
+            return
+        if len(cur_info.parents) > 1:
+            break
+        cur = cur_info.parents[0]
+    else:
+        return
+
+    # Multi-parent ancestor: climb every branch.
+    q: list[str] = [cur]
+    visited: set[str] = {cur}
+    i = 0
+
+    while i < len(q):
+        cur = q[i]
+        i += 1
 
         if cur == target_local_id:
             raise LocalValidationError("MOVE would create a cycle")
 
-        if not snapshot.has(cur):
+        cur_info = files.get(cur)
+        if cur_info is None:
             # Parent outside of scope; stop climbing this branch.
             continue
 
-        cur_info = snapshot.get(cur)
         for parent in cur_info.parents:
             if parent not in visited:
+                visited.add(parent)
                 q.append(parent)
@@ -2,8 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Optional, Sequence
+import os
+from collections import Counter
+from dataclasses import dataclass, field
+from itertools import chain, filterfalse
+from operator import attrgetter
+from typing import Callable, Iterator, Optional, Sequence
 
 from gdrivemgr.auth import AuthInfo
 from gdrivemgr.controller import GoogleDriveController
@@ -21,15 +25,39 @@ from gdrivemgr.errors import (
     RateLimitError,
 )
 from gdrivemgr.local import GoogleDriveLocal
-from gdrivemgr.models import OperationResult, SyncResult
+from gdrivemgr.models import FileInfo, OperationResult, SyncResult
 from gdrivemgr.plan import Action, PlanOperation, SyncPlan
 from gdrivemgr.plan.preconditions import check_modified_time_precondition
-from gdrivemgr.util.mime import is_folder
+
+
+_IS_TRASHED = attrgetter("trashed")
+_STATUS = attrgetter("status")
+
+# Actions that apply_plan(batch=True) can group into runs.
+_BATCH_ACTIONS = frozenset(
+    {
+        Action.CREATE_FOLDER,
+        Action.COPY,
+        Action.RENAME,
+        Action.MOVE,
+        Action.TRASH,
+        Action.DELETE_PERMANENT,
+        Action.UPLOAD_FILE,
+        Action.DOWNLOAD_FILE,
+    }
+)
+_DELETE_ACTIONS = frozenset({Action.TRASH, Action.DELETE_PERMANENT})
+# Media actions: never batched by Drive, transferred concurrently instead.
+_MEDIA_ACTIONS = frozenset({Action.UPLOAD_FILE, Action.DOWNLOAD_FILE})
+# Actions whose effect on a folder target reaches its whole subtree.
+_TREE_ACTIONS = frozenset({Action.MOVE, Action.TRASH, Action.DELETE_PERMANENT})
 
 
 @dataclass(frozen=True)
 class _ApplyContext:
     id_map: dict[str, str]
+    # local_id -> Drive file_id for every id resolved or created so far.
+    file_ids: dict[str, str] = field(default_factory=dict)
 
 
 class GoogleDriveManager:
@@ -41,35 +69,74 @@ class GoogleDriveManager:
         *,
         scopes: Optional[Sequence[str]] = None,
         supports_all_drives: bool = True,
+        max_workers: int = 4,
+        auto_refresh: bool = True,
     ) -> None:
+        """
+        Args:
+            max_workers: Worker threads for tree listing and for concurrent
+                uploads/downloads in apply_plan(batch=True).
+            auto_refresh: If False, apply_plan does not reload the snapshot;
+                it is reloaded on the next access to `local` instead.
+        """
         self._controller = GoogleDriveController(
             auth_info,
             scopes=scopes,
             supports_all_drives=supports_all_drives,
+            max_workers=max_workers,
         )
         self._local: Optional[GoogleDriveLocal] = None
         self._remote_root_id: Optional[str] = None
+        self._full_metadata = True
+        self._auto_refresh = auto_refresh
+        self._snapshot_dirty = False
+        self._init_dispatch()
 
     @classmethod
-    def from_controller(cls, controller: GoogleDriveController) -> "GoogleDriveManager":
+    def from_controller(
+        cls,
+        controller: GoogleDriveController,
+        *,
+        auto_refresh: bool = True,
+    ) -> "GoogleDriveManager":
         """Create manager with an injected controller (useful for tests)."""
         obj = cls.__new__(cls)
         obj._controller = controller
         obj._local = None
         obj._remote_root_id = None
+        obj._full_metadata = True
+        obj._auto_refresh = auto_refresh
+        obj._snapshot_dirty = False
+        obj._init_dispatch()
         return obj
 
     @property
     def local(self) -> GoogleDriveLocal:
-        """Return the current local view. Requires open() first."""
+        """
+        Return the current local view. Requires open() first.
+
+        With auto_refresh=False, the first access after apply_plan reloads
+        the snapshot from Drive (errors are raised).
+        """
+        if self._snapshot_dirty:
+            self.open(self._remote_root_id, full_metadata=self._full_metadata)  # type: ignore[arg-type]
         if self._local is None:
             raise InvalidStateError("Local is not initialized. Call open() first.")
         return self._local
 
-    def open(self, remote_root_id: str) -> GoogleDriveLocal:
+    def open(
+        self,
+        remote_root_id: str,
+        *,
+        full_metadata: bool = True,
+    ) -> GoogleDriveLocal:
         """
         Load Drive subtree under remote_root_id and build GoogleDriveLocal.
 
+        Args:
+            full_metadata: If False, the tree scan skips createdTime, size and
+                md5Checksum (left as None) to shrink list responses.
+
         Raises:
             InvalidStateError: if pending ops exist (must apply/clear first).
             InvalidArgumentError: if remote_root_id is not a folder.
@@ -78,18 +145,26 @@ class GoogleDriveManager:
             raise InvalidStateError("Pending operations exist. Apply/clear first.")
 
         root = self._controller.get(remote_root_id)
-        if not is_folder(root.mime_type):
+        if not root.is_folder:
             raise InvalidArgumentError("remote_root_id must be a folder")
 
         # Treat as scope root: clear parents to avoid linking outside.
         root.parents = []
 
-        descendants = self._controller.list_tree(remote_root_id, include_trashed=False)
-        file_infos = [root] + [f for f in descendants if not f.trashed]
+        descendants = self._controller.list_tree(
+            remote_root_id,
+            include_trashed=False,
+            full_metadata=full_metadata,
+        )
+        # list_tree already excludes trashed items server-side; the filter
+        # only guards the invariant and streams into the snapshot build.
+        file_infos = chain((root,), filterfalse(_IS_TRASHED, descendants))
 
         local = GoogleDriveLocal.from_file_infos(remote_root_id, file_infos)
         self._local = local
         self._remote_root_id = remote_root_id
+        self._full_metadata = full_metadata
+        self._snapshot_dirty = False
         return local
 
     def refresh_snapshot(self) -> None:
@@ -98,32 +173,43 @@ class GoogleDriveManager:
             raise InvalidStateError("No root opened. Call open() first.")
         if self._local is not None and self._local.list_ops():
             raise InvalidStateError("Pending operations exist. Apply/clear first.")
-        self.open(self._remote_root_id)
+        self.open(self._remote_root_id, full_metadata=self._full_metadata)
 
     def build_plan(self) -> SyncPlan:
         """Build a SyncPlan from current local pending operations."""
         return self.local.build_plan()
 
-    def sync(self, *, execute: bool = False) -> SyncPlan | SyncResult:
+    def sync(self, *, execute: bool = False, batch: bool = False) -> SyncPlan | SyncResult:
         """
         Convenience API.
 
         - execute=False: build and return SyncPlan
         - execute=True: build, apply, and return SyncResult
+          (batch is passed to apply_plan)
         """
         plan = self.build_plan()
         if not execute:
             return plan
-        return self.apply_plan(plan)
+        return self.apply_plan(plan, batch=batch)
 
-    def apply_plan(self, plan: SyncPlan) -> SyncResult:
+    def apply_plan(self, plan: SyncPlan, *, batch: bool = False) -> SyncResult:
         """
         Apply SyncPlan to Drive.
 
+        Args:
+            batch: If True, runs of independent metadata operations (create
+                folder, copy, rename, move, trash, delete) are sent as Drive
+                batch requests instead of one call each, and runs of
+                independent uploads/downloads are transferred concurrently.
+
         Policy:
             - Fail-fast for non-fatal errors: return SyncResult.failed (no raise).
             - Raise for fatal errors: Auth/Permission/InvalidArgument/InvalidState.
-            - After apply attempt: clear local ops and try to refresh snapshot.
+            - After apply attempt: clear local ops and try to refresh snapshot
+              (deferred to the next `local` access if auto_refresh is off).
+            - With batch=True, fail-fast works per run: operations sent in
+              the same run as a failing one may have been applied too, and
+              their results are reported as well.
         """
         if self._remote_root_id is None or self._local is None:
             raise InvalidStateError("No root opened. Call open() first.")
@@ -132,31 +218,14 @@ class GoogleDriveManager:
 
         ops_by_id = _index_operations(plan.operations)
         _validate_apply_order(plan.apply_order, ops_by_id)
+        ops = [ops_by_id[op_id] for op_id in plan.apply_order]
 
         ctx = _ApplyContext(id_map={})
         results: list[OperationResult] = []
-        stopped_op_id: Optional[str] = None
-
-        for op_id in plan.apply_order:
-            op = ops_by_id[op_id]
-            try:
-                op.validate_required_fields()
-            except ValueError as exc:
-                raise InvalidArgumentError(
-                    "Invalid operation: missing required fields",
-                    details={"op_id": op.op_id, "action": op.action.value},
-                    cause=exc,
-                ) from exc
-
-            try:
-                self._apply_one(op, ctx)
-                results.append(_success_result(op, ctx))
-            except GDriveMgrError as exc:
-                if _is_fatal(exc):
-                    raise
-                results.append(_failed_result(op, exc))
-                stopped_op_id = op.op_id
-                break
+        if batch:
+            stopped_op_id = self._apply_batched(ops, ctx, results)
+        else:
+            stopped_op_id = self._apply_sequential(ops, ctx, results)
 
         status = "failed" if stopped_op_id is not None else "success"
         summary = _summarize_results(results)
@@ -164,19 +233,23 @@ class GoogleDriveManager:
         # Clear pending ops regardless of success/failure.
         self._local.clear_ops()
 
-        # Always attempt refresh snapshot (do not raise on refresh failure).
-        snapshot_refreshed = True
-        try:
-            self.open(plan.remote_root_id)
-        except Exception:
-            snapshot_refreshed = False
-            summary["refresh_failed"] = summary.get("refresh_failed", 0) + 1
+        # Refresh snapshot now (do not raise on refresh failure), or leave it
+        # to the next `local` access when auto_refresh is off.
+        snapshot_refreshed = False
+        if self._auto_refresh:
+            try:
+                self.open(plan.remote_root_id, full_metadata=self._full_metadata)
+                snapshot_refreshed = True
+            except Exception:
+                summary["refresh_failed"] = summary.get("refresh_failed", 0) + 1
+        else:
+            self._snapshot_dirty = True
 
         return SyncResult(
             status=status,  # type: ignore[arg-type]
             stopped_op_id=stopped_op_id,
             results=results,
-            id_map=dict(ctx.id_map),
+            id_map=ctx.id_map,  # ctx is local to this call; no copy needed
             summary=summary,
             snapshot_refreshed=snapshot_refreshed,
         )
@@ -184,78 +257,352 @@ class GoogleDriveManager:
     # ----------------------------
     # Internals
     # ----------------------------
-    def _apply_one(self, op: PlanOperation, ctx: _ApplyContext) -> None:
-        """Apply one operation. Raises gdrivemgr errors on failure."""
-        # Precondition check (modified_time only).
-        if op.precondition and op.target_local_id:
-            target_file_id = self._resolve_file_id(op.target_local_id, ctx)
-            actual = self._controller.get(target_file_id).modified_time
-            check_modified_time_precondition(op.precondition, actual)
+    def _apply_sequential(
+        self,
+        ops: list[PlanOperation],
+        ctx: _ApplyContext,
+        results: list[OperationResult],
+    ) -> Optional[str]:
+        """Apply ops one call at a time; return the op_id that failed, if any."""
+        for op in ops:
+            _validate_operation(op)
+            try:
+                self._apply_one(op, ctx)
+                results.append(_success_result(op, ctx))
+            except GDriveMgrError as exc:
+                if _is_fatal(exc):
+                    raise
+                results.append(_failed_result(op, exc))
+                return op.op_id
+        return None
+
+    def _apply_batched(
+        self,
+        ops: list[PlanOperation],
+        ctx: _ApplyContext,
+        results: list[OperationResult],
+    ) -> Optional[str]:
+        """Apply ops run by run; return the op_id that failed first, if any."""
+        for run in self._iter_batch_runs(ops):
+            if len(run) == 1:
+                stopped_op_id = self._apply_sequential(run, ctx, results)
+            else:
+                stopped_op_id = self._apply_batch(run, ctx, results)
+            if stopped_op_id is not None:
+                return stopped_op_id
+        return None
+
+    def _iter_batch_runs(self, ops: list[PlanOperation]) -> Iterator[list[PlanOperation]]:
+        """
+        Split ops (in apply order) into runs that can share one batch.
 
+        Within a run no op touches an id written by another op (created,
+        renamed, moved, trashed or deleted), nor a local file written by a
+        download, so the calls may complete in any order. Metadata ops,
+        trash/delete ops and media ops never share a run.
+        """
+        run: list[PlanOperation] = []
+        written: set[str] = set()
+        read: set[str] = set()
+        run_kind = ""
+
+        for op in ops:
+            _validate_operation(op)
+            if not self._is_batchable(op):
+                if run:
+                    yield run
+                    run, written, read = [], set(), set()
+                yield [op]
+                continue
+
+            op_writes, op_reads = _batch_ids(op)
+            kind = _run_kind(op)
+            if run and (
+                kind != run_kind
+                or not written.isdisjoint(op_reads)
+                or not written.isdisjoint(op_writes)
+                or not read.isdisjoint(op_writes)
+            ):
+                yield run
+                run, written, read = [], set(), set()
+
+            run.append(op)
+            written |= op_writes
+            read |= op_reads
+            run_kind = kind
+
+        if run:
+            yield run
+
+    def _is_batchable(self, op: PlanOperation) -> bool:
+        if op.action not in _BATCH_ACTIONS:
+            return False
+        if op.action is Action.MOVE and not op.precondition:
+            # Without the precondition get the old parents are unknown.
+            return False
+        if op.action in _TREE_ACTIONS:
+            # Moving or deleting a folder changes its whole subtree; keep
+            # those ops on their own so ordering against other ops holds.
+            try:
+                return not self.local.get(op.target_local_id).is_folder  # type: ignore[arg-type]
+            except GDriveMgrError:
+                return False
+        return True
+
+    def _apply_batch(
+        self,
+        run: list[PlanOperation],
+        ctx: _ApplyContext,
+        results: list[OperationResult],
+    ) -> Optional[str]:
+        """Apply one run through controller.apply_batch or transfer_many."""
+        try:
+            currents = self._fetch_precondition_targets(run, ctx)
+        except GDriveMgrError as exc:
+            if _is_fatal(exc):
+                raise
+            results.append(_failed_result(run[0], exc))
+            return run[0].op_id
+
+        # Preconditions are checked before sending: a conflict stops the run
+        # at that op, exactly like the sequential path.
+        calls = []
+        precheck_failure: Optional[tuple[PlanOperation, GDriveMgrError]] = None
+        for index, op in enumerate(run):
+            try:
+                current = currents.get(index)
+                if isinstance(current, GDriveMgrError):
+                    raise current
+                if current is not None:
+                    check_modified_time_precondition(op.precondition, current.modified_time)
+                calls.append(self._batch_call(op, ctx, current))
+            except GDriveMgrError as exc:
+                if _is_fatal(exc):
+                    raise
+                precheck_failure = (op, exc)
+                break
+
+        stopped_op_id: Optional[str] = None
+        if calls:
+            try:
+                if run[0].action in _MEDIA_ACTIONS:
+                    outcomes = self._controller.transfer_many(calls)
+                else:
+                    outcomes = dict(enumerate(self._controller.apply_batch(calls)))
+            except GDriveMgrError as exc:
+                if _is_fatal(exc):
+                    raise
+                results.append(_failed_result(run[0], exc))
+                return run[0].op_id
+
+            for index, op in enumerate(run[:len(calls)]):
+                if index not in outcomes:
+                    # Cancelled after an earlier failure; never started.
+                    continue
+                outcome = outcomes[index]
+                if isinstance(outcome, GDriveMgrError):
+                    if _is_fatal(outcome):
+                        raise outcome
+                    results.append(_failed_result(op, outcome))
+                    if stopped_op_id is None:
+                        stopped_op_id = op.op_id
+                    continue
+                if op.result_local_id:
+                    _store_created_id(ctx, op.result_local_id, outcome.file_id)
+                results.append(_success_result(op, ctx))
+
+        if precheck_failure is not None and stopped_op_id is None:
+            op, exc = precheck_failure
+            results.append(_failed_result(op, exc))
+            stopped_op_id = op.op_id
+        return stopped_op_id
+
+    def _fetch_precondition_targets(
+        self,
+        run: list[PlanOperation],
+        ctx: _ApplyContext,
+    ) -> dict[int, object]:
+        """
+        Fetch the targets of the run's precondition ops in one batch.
+
+        Returns:
+            run index -> FileInfo, or the error met for that op.
+        """
+        currents: dict[int, object] = {}
+        gets: list[tuple[int, tuple[str, tuple]]] = []
+        for index, op in enumerate(run):
+            if not (op.precondition and op.target_local_id):
+                continue
+            try:
+                file_id = self._resolve_file_id(op.target_local_id, ctx)
+            except GDriveMgrError as exc:
+                currents[index] = exc
+                break  # nothing after this op is sent
+            gets.append((index, ("get", (file_id,))))
+
+        if gets:
+            outcomes = self._controller.apply_batch([call for _, call in gets])
+            currents.update(zip((index for index, _ in gets), outcomes))
+        return currents
+
+    def _batch_call(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> tuple[str, tuple]:
+        """Return op's call for controller.apply_batch/transfer_many."""
         if op.action is Action.CREATE_FOLDER:
             parent_id = self._resolve_file_id(op.parent_local_id, ctx)
-            info = self._controller.create_folder(op.name, parent_id)  # type: ignore[arg-type]
-            _store_created_id(ctx, op.result_local_id, info.file_id)
-            return
+            return ("create_folder", (op.name, parent_id))
+        if op.action is Action.UPLOAD_FILE:
+            parent_id = self._resolve_file_id(op.parent_local_id, ctx)
+            return ("upload_file", (op.local_path, parent_id, op.name))
 
+        file_id = self._resolve_file_id(op.target_local_id, ctx)
         if op.action is Action.COPY:
-            src_id = self._resolve_file_id(op.target_local_id, ctx)
             parent_id = self._resolve_file_id(op.new_parent_local_id, ctx)
-            info = self._controller.copy(src_id, parent_id, new_name=op.name)
-            _store_created_id(ctx, op.result_local_id, info.file_id)
-            return
-
+            return ("copy", (file_id, parent_id, op.name))
         if op.action is Action.RENAME:
-            file_id = self._resolve_file_id(op.target_local_id, ctx)
-            self._controller.rename(file_id, op.name)  # type: ignore[arg-type]
-            return
-
+            return ("rename", (file_id, op.name))
         if op.action is Action.MOVE:
-            file_id = self._resolve_file_id(op.target_local_id, ctx)
             parent_id = self._resolve_file_id(op.new_parent_local_id, ctx)
-            self._controller.move(file_id, parent_id)
-            return
-
+            # Batched moves always carry a precondition (see _is_batchable).
+            return ("move", (file_id, parent_id, current.parents))  # type: ignore[union-attr]
         if op.action is Action.TRASH:
-            file_id = self._resolve_file_id(op.target_local_id, ctx)
-            self._controller.trash(file_id)
-            return
-
+            return ("trash", (file_id,))
         if op.action is Action.DELETE_PERMANENT:
-            file_id = self._resolve_file_id(op.target_local_id, ctx)
-            self._controller.delete_permanently(file_id)
-            return
+            return ("delete_permanently", (file_id,))
+        return ("download_file", (file_id, op.local_path, bool(op.overwrite)))
+
+    def _check_precondition(self, op: PlanOperation, ctx: _ApplyContext) -> Optional[FileInfo]:
+        """Check the modified_time precondition; return the fetched FileInfo."""
+        if not (op.precondition and op.target_local_id):
+            return None
+        target_file_id = self._resolve_file_id(op.target_local_id, ctx)
+        current = self._controller.get(target_file_id)
+        check_modified_time_precondition(op.precondition, current.modified_time)
+        return current
 
-        if op.action is Action.UPLOAD_FILE:
-            parent_id = self._resolve_file_id(op.parent_local_id, ctx)
-            info = self._controller.upload_file(
-                op.local_path,  # type: ignore[arg-type]
-                parent_id,
-                name=op.name,
-            )
-            _store_created_id(ctx, op.result_local_id, info.file_id)
-            return
-
-        if op.action is Action.DOWNLOAD_FILE:
-            file_id = self._resolve_file_id(op.target_local_id, ctx)
-            self._controller.download_file(
-                file_id,
-                op.local_path,  # type: ignore[arg-type]
-                overwrite=bool(op.overwrite),
-            )
-            return
+    def _apply_one(self, op: PlanOperation, ctx: _ApplyContext) -> None:
+        """Apply one operation. Raises gdrivemgr errors on failure."""
+        handler = self._dispatch.get(op.action)
+        if handler is None:
+            raise InvalidArgumentError("Unsupported action", details={"action": op.action})
+        handler(op, ctx, self._check_precondition(op, ctx))
+
+    def _init_dispatch(self) -> None:
+        # Action -> handler(op, ctx, current); current is the FileInfo fetched
+        # for the precondition check, if any.
+        self._dispatch: dict[Action, Callable[..., None]] = {
+            Action.CREATE_FOLDER: self._do_create_folder,
+            Action.COPY: self._do_copy,
+            Action.RENAME: self._do_rename,
+            Action.MOVE: self._do_move,
+            Action.TRASH: self._do_trash,
+            Action.DELETE_PERMANENT: self._do_delete_permanent,
+            Action.UPLOAD_FILE: self._do_upload_file,
+            Action.DOWNLOAD_FILE: self._do_download_file,
+        }
+
+    def _do_create_folder(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        parent_id = self._resolve_file_id(op.parent_local_id, ctx)
+        info = self._controller.create_folder(op.name, parent_id)  # type: ignore[arg-type]
+        _store_created_id(ctx, op.result_local_id, info.file_id)
+
+    def _do_copy(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        src_id = self._resolve_file_id(op.target_local_id, ctx)
+        parent_id = self._resolve_file_id(op.new_parent_local_id, ctx)
+        info = self._controller.copy(src_id, parent_id, new_name=op.name)
+        _store_created_id(ctx, op.result_local_id, info.file_id)
+
+    def _do_rename(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        file_id = self._resolve_file_id(op.target_local_id, ctx)
+        self._controller.rename(file_id, op.name)  # type: ignore[arg-type]
+
+    def _do_move(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        file_id = self._resolve_file_id(op.target_local_id, ctx)
+        parent_id = self._resolve_file_id(op.new_parent_local_id, ctx)
+        # Reuse the parents fetched for the precondition check, if any.
+        old_parents = current.parents if current is not None else None
+        self._controller.move(file_id, parent_id, old_parents=old_parents)
+
+    def _do_trash(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        file_id = self._resolve_file_id(op.target_local_id, ctx)
+        self._controller.trash(file_id)
+
+    def _do_delete_permanent(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        file_id = self._resolve_file_id(op.target_local_id, ctx)
+        self._controller.delete_permanently(file_id)
 
-        raise InvalidArgumentError("Unsupported action", details={"action": op.action})
+    def _do_upload_file(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        parent_id = self._resolve_file_id(op.parent_local_id, ctx)
+        info = self._controller.upload_file(
+            op.local_path,  # type: ignore[arg-type]
+            parent_id,
+            name=op.name,
+        )
+        _store_created_id(ctx, op.result_local_id, info.file_id)
+
+    def _do_download_file(
+        self,
+        op: PlanOperation,
+        ctx: _ApplyContext,
+        current: Optional[FileInfo],
+    ) -> None:
+        file_id = self._resolve_file_id(op.target_local_id, ctx)
+        self._controller.download_file(
+            file_id,
+            op.local_path,  # type: ignore[arg-type]
+            overwrite=bool(op.overwrite),
+        )
 
     def _resolve_file_id(self, local_id: Optional[str], ctx: _ApplyContext) -> str:
+        file_id = ctx.file_ids.get(local_id)  # type: ignore[arg-type]
+        if file_id is not None:
+            return file_id
+
         if not local_id:
             raise InvalidStateError("local_id is missing")
 
-        if local_id in ctx.id_map:
-            return ctx.id_map[local_id]
-
         info = self.local.get(local_id)
         if info.file_id:
+            ctx.file_ids[local_id] = info.file_id
             return info.file_id
 
         raise InvalidStateError(
@@ -270,18 +617,67 @@ def _store_created_id(ctx: _ApplyContext, result_local_id: Optional[str], file_i
     if not file_id:
         raise InvalidStateError("Drive did not return file_id for created item")
     ctx.id_map[result_local_id] = file_id
+    ctx.file_ids[result_local_id] = file_id
+
+
+def _run_kind(op: PlanOperation) -> str:
+    if op.action in _MEDIA_ACTIONS:
+        return "media"
+    if op.action in _DELETE_ACTIONS:
+        return "delete"
+    return "metadata"
+
+
+def _batch_ids(op: PlanOperation) -> tuple[set[str], set[str]]:
+    """
+    Return (ids the op writes, ids it only reads) for run partitioning.
+
+    Local files are tracked by absolute path, which never collides with a
+    local_id.
+    """
+    if op.action is Action.COPY:
+        writes = {op.result_local_id}
+        reads = {op.target_local_id, op.new_parent_local_id}
+    elif op.action is Action.UPLOAD_FILE:
+        writes = {op.result_local_id}
+        reads = {op.parent_local_id, os.path.abspath(op.local_path)}  # type: ignore[arg-type]
+    elif op.action is Action.DOWNLOAD_FILE:
+        writes = {os.path.abspath(op.local_path)}  # type: ignore[arg-type]
+        reads = {op.target_local_id}
+    else:
+        writes = {op.target_local_id, op.result_local_id}
+        reads = {op.parent_local_id, op.new_parent_local_id}
+    writes.discard(None)
+    reads.discard(None)
+    return writes, reads  # type: ignore[return-value]
+
+
+def _validate_operation(op: PlanOperation) -> None:
+    try:
+        op.validate_required_fields()
+    except ValueError as exc:
+        raise InvalidArgumentError(
+            "Invalid operation: missing required fields",
+            details={"op_id": op.op_id, "action": op.action.value},
+            cause=exc,
+        ) from exc
 
 
 def _index_operations(operations: list[PlanOperation]) -> dict[str, PlanOperation]:
-    ops_by_id: dict[str, PlanOperation] = {}
-    for op in operations:
-        if op.op_id in ops_by_id:
-            raise InvalidArgumentError("Duplicate op_id in plan", details={"op_id": op.op_id})
-        ops_by_id[op.op_id] = op
+    ops_by_id = {op.op_id: op for op in operations}
+    if len(ops_by_id) != len(operations):
+        # Only reached for invalid plans: locate the first duplicate.
+        seen: set[str] = set()
+        for op in operations:
+            if op.op_id in seen:
+                raise InvalidArgumentError("Duplicate op_id in plan", details={"op_id": op.op_id})
+            seen.add(op.op_id)
     return ops_by_id
 
 
 def _validate_apply_order(apply_order: list[str], ops_by_id: dict[str, PlanOperation]) -> None:
+    if ops_by_id.keys() >= set(apply_order):
+        return
     for op_id in apply_order:
         if op_id not in ops_by_id:
             raise InvalidArgumentError(
@@ -331,6 +727,5 @@ def _failed_result(op: PlanOperation, exc: GDriveMgrError) -> OperationResult:
 
 def _summarize_results(results: list[OperationResult]) -> dict[str, int]:
     summary: dict[str, int] = {"success": 0, "failed": 0, "skipped": 0}
-    for r in results:
-        summary[r.status] = summary.get(r.status, 0) + 1
+    summary.update(Counter(map(_STATUS, results)))
     return summary
@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Optional
 
+from gdrivemgr.util.mime import FOLDER_MIME
+
 
 @dataclass(slots=True)
 class FileInfo:
@@ -16,6 +18,8 @@ class FileInfo:
         - For existing Drive items: local_id == file_id (by spec).
         - For items not created on Drive yet: file_id is None and local_id is a
           generated UUID.
+        - is_folder is derived from mime_type at construction (mime_type is
+          never changed afterwards).
     """
 
     local_id: str
@@ -29,3 +33,8 @@ class FileInfo:
     created_time: Optional[datetime] = None
     size: Optional[int] = None
     md5_checksum: Optional[str] = None
+
+    is_folder: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        self.is_folder = self.mime_type == FOLDER_MIME
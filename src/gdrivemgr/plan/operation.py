@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from typing import Any, Optional
 
 from .actions import Action
@@ -32,48 +32,35 @@ class PlanOperation:
     local_path: Optional[str] = None
     overwrite: Optional[bool] = None
 
-    def validate_required_fields(self) -> None:
-        """Validate required fields according to action. Raises ValueError."""
-        if self.action is Action.CREATE_FOLDER:
-            _require(self.parent_local_id, "parent_local_id")
-            _require(self.name, "name")
-            _require(self.result_local_id, "result_local_id")
-            return
-
-        if self.action is Action.COPY:
-            _require(self.target_local_id, "target_local_id")
-            _require(self.new_parent_local_id, "new_parent_local_id")
-            _require(self.result_local_id, "result_local_id")
-            return
-
-        if self.action is Action.RENAME:
-            _require(self.target_local_id, "target_local_id")
-            _require(self.name, "name")
-            return
-
-        if self.action is Action.MOVE:
-            _require(self.target_local_id, "target_local_id")
-            _require(self.new_parent_local_id, "new_parent_local_id")
-            return
-
-        if self.action in (Action.TRASH, Action.DELETE_PERMANENT):
-            _require(self.target_local_id, "target_local_id")
-            return
+    def clone(self) -> PlanOperation:
+        """
+        Return an independent copy of this operation.
 
-        if self.action is Action.UPLOAD_FILE:
-            _require(self.parent_local_id, "parent_local_id")
-            _require(self.local_path, "local_path")
-            _require(self.result_local_id, "result_local_id")
-            return
+        All fields are immutable values except ``precondition``, which gets
+        its own (shallow) dict so it can be modified without affecting self.
+        """
+        precondition = dict(self.precondition) if self.precondition is not None else None
+        return replace(self, precondition=precondition)
 
-        if self.action is Action.DOWNLOAD_FILE:
-            _require(self.target_local_id, "target_local_id")
-            _require(self.local_path, "local_path")
-            return
-
-        raise ValueError(f"Unsupported action: {self.action}")
-
-
-def _require(value: object, field_name: str) -> None:
-    if value is None or (isinstance(value, str) and not value.strip()):
-        raise ValueError(f"Missing required field: {field_name}")
+    def validate_required_fields(self) -> None:
+        """Validate required fields according to action. Raises ValueError."""
+        required = _REQUIRED_FIELDS.get(self.action)
+        if required is None:
+            raise ValueError(f"Unsupported action: {self.action}")
+        for field_name in required:
+            value = getattr(self, field_name)
+            if value is None or (isinstance(value, str) and not value.strip()):
+                raise ValueError(f"Missing required field: {field_name}")
+
+
+# Required fields per action, checked in this order.
+_REQUIRED_FIELDS: dict[Action, tuple[str, ...]] = {
+    Action.CREATE_FOLDER: ("parent_local_id", "name", "result_local_id"),
+    Action.COPY: ("target_local_id", "new_parent_local_id", "result_local_id"),
+    Action.RENAME: ("target_local_id", "name"),
+    Action.MOVE: ("target_local_id", "new_parent_local_id"),
+    Action.TRASH: ("target_local_id",),
+    Action.DELETE_PERMANENT: ("target_local_id",),
+    Action.UPLOAD_FILE: ("parent_local_id", "local_path", "result_local_id"),
+    Action.DOWNLOAD_FILE: ("target_local_id", "local_path"),
+}
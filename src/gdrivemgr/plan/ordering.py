@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import Optional
 
 from .actions import Action
 from .operation import PlanOperation
 
 
-_DELETE_ACTIONS: set[Action] = {Action.TRASH, Action.DELETE_PERMANENT}
+_DELETE_ACTIONS: frozenset[Action] = frozenset({Action.TRASH, Action.DELETE_PERMANENT})
 
 
 def build_apply_order(
@@ -24,46 +25,34 @@ def build_apply_order(
           reorder within the block by depth (deep -> shallow) if depth is known
           for all delete targets in the block. Otherwise keep seq order.
     """
-    ops = sorted(operations, key=lambda op: op.seq)
-    reordered: list[PlanOperation] = []
-
+    ops = sorted(operations, key=attrgetter("seq"))
+    if not depth_by_local_id:
+        return [op.op_id for op in ops]
+
+    # One sort key per op: (block start, -depth, seq) inside reorderable
+    # delete blocks, (position, 0, 0) elsewhere; one final sort applies both.
+    depth_get = depth_by_local_id.get
+    is_delete = _DELETE_ACTIONS.__contains__
+    keys: list[tuple[int, int, int]] = []
+    n = len(ops)
     i = 0
-    while i < len(ops):
+    while i < n:
         op = ops[i]
-        if op.action not in _DELETE_ACTIONS:
-            reordered.append(op)
+        if not is_delete(op.action):
+            keys.append((i, 0, 0))
             i += 1
             continue
 
-        j = i
-        while j < len(ops) and ops[j].action in _DELETE_ACTIONS:
+        j = i + 1
+        while j < n and is_delete(ops[j].action):
             j += 1
 
-        block = ops[i:j]
-        reordered.extend(_reorder_delete_block(block, depth_by_local_id))
+        depths = [depth_get(ops[k].target_local_id) for k in range(i, j)]  # type: ignore[arg-type]
+        if None in depths:
+            keys.extend((k, 0, 0) for k in range(i, j))
+        else:
+            keys.extend((i, -d, ops[k].seq) for k, d in zip(range(i, j), depths))  # type: ignore[operator]
         i = j
 
-    return [op.op_id for op in reordered]
-
-
-def _reorder_delete_block(
-    block: list[PlanOperation],
-    depth_by_local_id: Optional[dict[str, int]],
-) -> list[PlanOperation]:
-    if not depth_by_local_id:
-        return block
-
-    depths: list[int] = []
-    for op in block:
-        target = op.target_local_id
-        if not target:
-            return block
-        if target not in depth_by_local_id:
-            return block
-        depths.append(depth_by_local_id[target])
-
-    # Sort deep -> shallow, tie-breaker: seq ascending.
-    return sorted(
-        block,
-        key=lambda op: (-depth_by_local_id[op.target_local_id], op.seq),  # type: ignore[index]
-    )
+    order = sorted(range(n), key=keys.__getitem__)
+    return [ops[k].op_id for k in order]
@@ -12,14 +12,16 @@ from gdrivemgr.util.time import same_instant
 from .actions import Action
 from .operation import PlanOperation
 
-PRECONDITION_ACTIONS: set[Action] = {
-    Action.RENAME,
-    Action.MOVE,
-    Action.TRASH,
-    Action.DELETE_PERMANENT,
-    Action.COPY,
-    Action.DOWNLOAD_FILE,
-}
+PRECONDITION_ACTIONS: frozenset[Action] = frozenset(
+    {
+        Action.RENAME,
+        Action.MOVE,
+        Action.TRASH,
+        Action.DELETE_PERMANENT,
+        Action.COPY,
+        Action.DOWNLOAD_FILE,
+    }
+)
 
 
 def build_modified_time_precondition(modified_time: datetime) -> dict[str, Any]:
@@ -39,17 +41,21 @@ def apply_default_preconditions(
         - target_local_id exists
         - target has modified_time
     """
+    wants_precondition = PRECONDITION_ACTIONS.__contains__
+    get_info = file_by_local_id.get
+    build = build_modified_time_precondition
     for op in operations:
-        if op.action not in PRECONDITION_ACTIONS:
+        if not wants_precondition(op.action):
             continue
-        if not op.target_local_id:
+        target = op.target_local_id
+        if not target:
             continue
 
-        info = file_by_local_id.get(op.target_local_id)
+        info = get_info(target)
         if not info or not info.modified_time:
             continue
 
-        op.precondition = build_modified_time_precondition(info.modified_time)
+        op.precondition = build(info.modified_time)
 
 
 def check_modified_time_precondition(
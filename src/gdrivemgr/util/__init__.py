@@ -2,6 +2,7 @@ from .ids import new_local_id, new_op_id, new_plan_id, new_uuid
 from .mime import (
     FOLDER_MIME,
     GOOGLE_APP_MIMES,
+    GOOGLE_APP_PREFIX,
     is_folder,
     is_google_app,
     is_google_docs_download_disallowed,
@@ -15,6 +16,7 @@ __all__ = [
     "new_local_id",
     "FOLDER_MIME",
     "GOOGLE_APP_MIMES",
+    "GOOGLE_APP_PREFIX",
     "is_folder",
     "is_google_app",
     "is_google_docs_download_disallowed",
@@ -1,23 +1,53 @@
 from __future__ import annotations
 
-import uuid
+import os
 
+_urandom = os.urandom
+
+# Random bytes are read in bulk and formatted into UUID strings one pool at a
+# time. next() on a list iterator is atomic, so concurrent callers never share
+# an id; a racing refill only discards the rest of a pool.
+_POOL_SIZE = 4096
+_ids = iter(())
+
+# RFC 4122 version-4 layout: the version nibble is always "4" and the variant
+# nibble keeps its two low random bits under a fixed "10" prefix.
+_VARIANT = {c: "89ab"[int(c, 16) & 3] for c in "0123456789abcdef"}
 
-def new_uuid() -> str:
-    """Generate a UUID4 string."""
-    return str(uuid.uuid4())
 
+def _refill() -> None:
+    global _ids
+    hex_pool = _urandom(_POOL_SIZE).hex()
+    v = _VARIANT
+    _ids = iter(
+        [
+            f"{h[:8]}-{h[8:12]}-4{h[13:16]}-{v[h[16]]}{h[17:20]}-{h[20:]}"
+            for h in (hex_pool[i:i + 32] for i in range(0, 2 * _POOL_SIZE, 32))
+        ]
+    )
 
-def new_plan_id() -> str:
-    """Generate a new SyncPlan ID."""
-    return new_uuid()
 
+def _reset_pool() -> None:
+    global _ids
+    _ids = iter(())
 
-def new_op_id() -> str:
-    """Generate a new PlanOperation ID."""
-    return new_uuid()
 
+# A forked child must not hand out the parent's remaining ids again.
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_pool)
 
-def new_local_id() -> str:
-    """Generate a new local_id for items that don't have a Drive file_id yet."""
-    return new_uuid()
+
+def new_uuid() -> str:
+    """Generate a UUID4 string (canonical dashed form)."""
+    value = next(_ids, None)
+    if value is None:
+        _refill()
+        return new_uuid()
+    return value
+
+
+# Plan, operation and local ids are all plain UUID4 strings; binding the
+# names directly saves a call frame per id.
+new_plan_id = new_uuid  # SyncPlan IDs
+new_op_id = new_uuid  # PlanOperation IDs
+new_local_id = new_uuid  # local_id for items that don't have a Drive file_id yet
@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from functools import lru_cache
+
 FOLDER_MIME: str = "application/vnd.google-apps.folder"
 
-# Minimal set needed for v1 behavior. (You can extend later if needed.)
+# Every Google apps type (folders included) starts with this prefix.
+GOOGLE_APP_PREFIX: str = "application/vnd.google-apps."
+
+# Well-known Google apps types (documentation; checks use GOOGLE_APP_PREFIX).
 GOOGLE_APP_MIMES: set[str] = {
     "application/vnd.google-apps.document",
     "application/vnd.google-apps.spreadsheet",
@@ -19,18 +24,20 @@ def is_folder(mime_type: str) -> bool:
     return mime_type == FOLDER_MIME
 
 
+# A sync only ever sees a handful of distinct MIME types, so the two prefix
+# checks below are cached; the cache wrapper also skips the Python call frame.
+@lru_cache(maxsize=256)
 def is_google_app(mime_type: str) -> bool:
     """
     Returns True if the MIME type is a Google 'apps' type.
 
-    Note: Some Google apps MIME types might not be listed in GOOGLE_APP_MIMES;
-    additionally, Google apps generally start with 'application/vnd.google-apps.'.
+    Note: every entry of GOOGLE_APP_MIMES starts with GOOGLE_APP_PREFIX, so
+    the prefix check alone covers them as well as unlisted types.
     """
-    if mime_type in GOOGLE_APP_MIMES:
-        return True
-    return mime_type.startswith("application/vnd.google-apps.")
+    return mime_type.startswith(GOOGLE_APP_PREFIX)
 
 
+@lru_cache(maxsize=256)
 def is_google_docs_download_disallowed(mime_type: str) -> bool:
     """
     v1 policy:
@@ -38,4 +45,5 @@ def is_google_docs_download_disallowed(mime_type: str) -> bool:
       via standard media download; export handling is out of scope.
     - Folders are also not downloadable.
     """
-    return is_folder(mime_type) or is_google_app(mime_type)
+    # FOLDER_MIME shares the Google apps prefix: one check covers both.
+    return mime_type.startswith(GOOGLE_APP_PREFIX)
@@ -2,10 +2,17 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+try:  # optional C parser; the stdlib path below is the fallback
+    from ciso8601 import parse_rfc3339 as _c_parse_rfc3339
+except ImportError:  # pragma: no cover
+    _c_parse_rfc3339 = None
+
+_UTC = timezone.utc
+
 
 def now_utc() -> datetime:
     """Return current time as tz-aware UTC datetime."""
-    return datetime.now(timezone.utc)
+    return datetime.now(_UTC)
 
 
 def parse_rfc3339(value: str) -> datetime:
@@ -20,14 +27,26 @@ def parse_rfc3339(value: str) -> datetime:
     if not isinstance(value, str) or not value:
         raise ValueError("RFC3339 value must be a non-empty string")
 
+    if _c_parse_rfc3339 is not None:
+        try:
+            dt = _c_parse_rfc3339(value)
+        except ValueError:
+            pass  # fall back to the lenient stdlib parser below
+        else:
+            # "...Z" (what Drive sends) already parses to the UTC singleton.
+            return dt if dt.tzinfo is _UTC else dt.astimezone(_UTC)
+
     s = value.strip()
     # Python's fromisoformat doesn't accept 'Z' in 3.9/3.10, so normalize.
     if s.endswith("Z"):
         s = s[:-1] + "+00:00"
 
     dt = datetime.fromisoformat(s)  # raises ValueError if invalid
-    dt = normalize_dt(dt)
-    return dt.astimezone(timezone.utc)
+    if dt.tzinfo is _UTC:
+        return dt
+    if dt.tzinfo is None:
+        raise ValueError("naive datetime is not allowed; timezone-aware required")
+    return dt.astimezone(_UTC)
 
 
 def to_rfc3339(dt: datetime) -> str:
@@ -36,7 +55,8 @@ def to_rfc3339(dt: datetime) -> str:
 
     Keeps microseconds if present.
     """
-    dt = normalize_dt(dt).astimezone(timezone.utc)
+    if type(dt) is not datetime or dt.tzinfo is not _UTC:
+        dt = normalize_dt(dt).astimezone(_UTC)
     # Keep microseconds (Drive may return fractional seconds).
     s = dt.isoformat(timespec="microseconds")
     return s.replace("+00:00", "Z")
@@ -53,6 +73,9 @@ def normalize_dt(dt: datetime) -> datetime:
 
 def same_instant(a: datetime, b: datetime) -> bool:
     """Return True if two tz-aware datetimes represent the same instant in time."""
-    a_utc = normalize_dt(a).astimezone(timezone.utc)
-    b_utc = normalize_dt(b).astimezone(timezone.utc)
+    # parse_rfc3339 returns UTC datetimes, so this is the usual case.
+    if type(a) is datetime and type(b) is datetime and a.tzinfo is _UTC and b.tzinfo is _UTC:
+        return a == b
+    a_utc = normalize_dt(a).astimezone(_UTC)
+    b_utc = normalize_dt(b).astimezone(_UTC)
     return a_utc == b_utc
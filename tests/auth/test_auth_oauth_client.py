@@ -6,31 +6,34 @@ from pathlib import Path
 from gdrivemgr.auth import AuthInfo, OAuthClient
 
 
+_TOKEN_PAYLOAD = {
+    "token": "fake-token",
+    "refresh_token": "fake-refresh-token",
+    "token_uri": "https://oauth2.googleapis.com/token",
+    "client_id": "fake-client-id",
+    "client_secret": "fake-client-secret",
+    "scopes": ["https://www.googleapis.com/auth/drive.readonly"],
+    "type": "authorized_user",
+}
+
+
 class TestOAuthClient(unittest.TestCase):
+    def _make_client(self, tmp_path: Path) -> OAuthClient:
+        token_file = tmp_path / "token.json"
+        token_file.write_text(json.dumps(_TOKEN_PAYLOAD), encoding="utf-8")
+
+        info = AuthInfo(
+            kind="oauth",
+            data={
+                "client_secrets_file": str(tmp_path / "client_secrets.json"),
+                "token_file": str(token_file),
+            },
+        )
+        return OAuthClient(info)
+
     def test_get_credentials_loads_token_file_without_refresh(self) -> None:
         with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            token_file = tmp_path / "token.json"
-
-            token_payload = {
-                "token": "fake-token",
-                "refresh_token": "fake-refresh-token",
-                "token_uri": "https://oauth2.googleapis.com/token",
-                "client_id": "fake-client-id",
-                "client_secret": "fake-client-secret",
-                "scopes": ["https://www.googleapis.com/auth/drive.readonly"],
-                "type": "authorized_user",
-            }
-            token_file.write_text(json.dumps(token_payload), encoding="utf-8")
-
-            info = AuthInfo(
-                kind="oauth",
-                data={
-                    "client_secrets_file": str(tmp_path / "client_secrets.json"),
-                    "token_file": str(token_file),
-                },
-            )
-            client = OAuthClient(info)
+            client = self._make_client(Path(tmp))
             creds = client.get_credentials(
                 scopes=["https://www.googleapis.com/auth/drive.readonly"],
                 ensure_valid=False,
@@ -40,6 +43,32 @@ class TestOAuthClient(unittest.TestCase):
             self.assertTrue(hasattr(creds, "refresh_token"))
             self.assertEqual(creds.refresh_token, "fake-refresh-token")
 
+    def test_build_drive_service_uses_authorized_http(self) -> None:
+        from google_auth_httplib2 import AuthorizedHttp
+
+        with tempfile.TemporaryDirectory() as tmp:
+            client = self._make_client(Path(tmp))
+            service = client.build_drive_service(
+                ["https://www.googleapis.com/auth/drive.readonly"],
+                ensure_valid=False,
+            )
+
+            self.assertIsInstance(service._http, AuthorizedHttp)
+            self.assertEqual(service._http.credentials.refresh_token, "fake-refresh-token")
+
+    def test_get_credentials_reuses_cached_credentials(self) -> None:
+        scopes = ["https://www.googleapis.com/auth/drive.readonly"]
+        with tempfile.TemporaryDirectory() as tmp:
+            tmp_path = Path(tmp)
+            client = self._make_client(tmp_path)
+            first = client.get_credentials(scopes=scopes, ensure_valid=False)
+
+            # The token file is not read again once credentials are cached.
+            (tmp_path / "token.json").unlink()
+            second = client.get_credentials(scopes=scopes, ensure_valid=False)
+
+            self.assertIs(first, second)
+
 
 if __name__ == "__main__":
     unittest.main()
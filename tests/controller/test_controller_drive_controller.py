@@ -1,7 +1,8 @@
-import json
+import os
+import tempfile
 import unittest
 from datetime import datetime, timezone
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from gdrivemgr.controller.drive_controller import (
     GoogleDriveController,
@@ -11,17 +12,117 @@ from gdrivemgr.errors import NotFoundError, RateLimitError
 from gdrivemgr.util.time import to_rfc3339
 
 
+class FakeRequest:
+    """Drive request stub: execute() returns (or raises) queued responses in turn."""
+
+    def __init__(self, *responses) -> None:
+        self._responses = iter(responses)
+        self.call_count = 0
+
+    def execute(self, http=None):
+        self.call_count += 1
+        response = next(self._responses)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+class FakeFiles:
+    """
+    files() resource stub.
+
+    Each method returns its configured request (or calls it with the kwargs
+    when it is a function) and records the kwargs of its last call.
+    """
+
+    def __init__(self, **requests) -> None:
+        self._requests = requests
+        self.kwargs: dict[str, dict] = {}
+
+    def _call(self, method: str, kwargs: dict):
+        self.kwargs[method] = kwargs
+        request = self._requests[method]
+        return request(**kwargs) if callable(request) else request
+
+    def list(self, **kwargs):
+        return self._call("list", kwargs)
+
+    def get(self, **kwargs):
+        return self._call("get", kwargs)
+
+    def update(self, **kwargs):
+        return self._call("update", kwargs)
+
+    def create(self, **kwargs):
+        return self._call("create", kwargs)
+
+    def delete(self, **kwargs):
+        return self._call("delete", kwargs)
+
+
+class FakeBatch:
+    """BatchHttpRequest stub: execute() runs the added requests in order."""
+
+    def __init__(self, callback, log: list) -> None:
+        self._callback = callback
+        self._log = log
+        self._added = []
+
+    def add(self, request, request_id) -> None:
+        self._added.append((request_id, request))
+
+    def execute(self, http=None) -> None:
+        self._log.append(([rid for rid, _ in self._added], http))
+        for request_id, request in self._added:
+            try:
+                response = request.execute()
+            except Exception as exc:
+                self._callback(request_id, None, exc)
+            else:
+                self._callback(request_id, response, None)
+
+
+class FakeService:
+    """Drive service stub; every executed batch is logged in ``batches``."""
+
+    def __init__(self, files: FakeFiles) -> None:
+        self._files = files
+        self.batches: list = []
+
+    def files(self) -> FakeFiles:
+        return self._files
+
+    def new_batch_http_request(self, callback) -> FakeBatch:
+        return FakeBatch(callback, self.batches)
+
+
+def _http_error(status: int, content: bytes = b"{}", **headers: str):
+    import httplib2
+    from googleapiclient.errors import HttpError
+
+    resp = httplib2.Response({"status": status, **headers})
+    return HttpError(resp=resp, content=content)
+
+
+_RATE_LIMIT_BODY = (
+    b'{"error": {"message": "rate limited", "errors": [{"reason": "rateLimitExceeded"}]}}'
+)
+
+
+_DT = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+_DT_RFC3339 = to_rfc3339(_DT)
+
+
 class TestDriveControllerHelpers(unittest.TestCase):
     def test_file_dict_to_file_info_parses_times(self) -> None:
-        dt = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
         data = {
             "id": "F1",
             "name": "n",
             "mimeType": "text/plain",
             "parents": ["P1"],
             "trashed": False,
-            "modifiedTime": to_rfc3339(dt),
-            "createdTime": to_rfc3339(dt),
+            "modifiedTime": _DT_RFC3339,
+            "createdTime": _DT_RFC3339,
             "size": "123",
             "md5Checksum": "abc",
         }
@@ -30,23 +131,17 @@ class TestDriveControllerHelpers(unittest.TestCase):
         self.assertEqual(info.file_id, "F1")
         self.assertEqual(info.size, 123)
         self.assertEqual(info.md5_checksum, "abc")
-        self.assertEqual(info.modified_time, dt)
-        self.assertEqual(info.created_time, dt)
+        self.assertEqual(info.modified_time, _DT)
+        self.assertEqual(info.created_time, _DT)
 
 
+# Retry backoff never really sleeps in these tests.
+@patch("gdrivemgr.controller.drive_controller.time.sleep", new=lambda *_: None)
 class TestDriveControllerMocked(unittest.TestCase):
     def _mock_service_with_list(self, files_payload, next_token=None):
-        service = Mock()
-        files_resource = Mock()
-        request = Mock()
-
-        service.files.return_value = files_resource
-        request.execute.return_value = {
-            "files": files_payload,
-            "nextPageToken": next_token,
-        }
-        files_resource.list.return_value = request
-        return service, files_resource, request
+        request = FakeRequest({"files": files_payload, "nextPageToken": next_token})
+        service = FakeService(FakeFiles(list=request))
+        return service, service.files(), request
 
     def test_list_children_includes_supports_all_drives_kwargs(self) -> None:
         service, files_resource, _ = self._mock_service_with_list([])
@@ -54,94 +149,180 @@ class TestDriveControllerMocked(unittest.TestCase):
 
         controller.list_children("P1")
 
-        kwargs = files_resource.list.call_args.kwargs
+        kwargs = files_resource.kwargs["list"]
         self.assertTrue(kwargs.get("supportsAllDrives"))
         self.assertTrue(kwargs.get("includeItemsFromAllDrives"))
         self.assertIn("'P1' in parents", kwargs["q"])
+        self.assertEqual(kwargs["pageSize"], 1000)
 
-    def test_get_maps_http_404_to_not_found(self) -> None:
-        from googleapiclient.errors import HttpError
+    def _mock_service_with_batches(self, listings, **requests):
+        def fake_list(**kwargs):
+            parent_id = kwargs["q"].split("'")[1]
+            return FakeRequest({"files": listings.get(parent_id, [])})
+
+        service = FakeService(FakeFiles(list=fake_list, **requests))
+        return service, service.batches
+
+    def test_list_tree_batches_each_level(self) -> None:
+        folder = "application/vnd.google-apps.folder"
+        listings = {
+            "root": [
+                {"id": "A", "name": "A", "mimeType": folder, "parents": ["root"]},
+                {"id": "B", "name": "B", "mimeType": folder, "parents": ["root"]},
+            ],
+            "A": [{"id": "F1", "name": "f1", "mimeType": "text/plain", "parents": ["A"]}],
+            "B": [{"id": "F2", "name": "f2", "mimeType": "text/plain", "parents": ["B"]}],
+        }
+        service, batches = self._mock_service_with_batches(listings)
+
+        controller = GoogleDriveController.from_service(service)
+        infos = controller.list_tree("root")
+
+        self.assertEqual([i.file_id for i in infos], ["A", "B", "F1", "F2"])
+        # Level 0 is a single request; level 1 (A, B) goes out as one batch.
+        self.assertEqual(batches, [(["A", "B"], None)])
+
+    def test_list_tree_can_request_tree_fields_only(self) -> None:
+        service, _ = self._mock_service_with_batches({})
+
+        controller = GoogleDriveController.from_service(service)
+        controller.list_tree("root", full_metadata=False)
+
+        fields = service.files().kwargs["list"]["fields"]
+        self.assertIn("modifiedTime", fields)
+        self.assertNotIn("md5Checksum", fields)
+
+    def test_list_tree_runs_large_levels_on_worker_threads(self) -> None:
+        folder = "application/vnd.google-apps.folder"
+        folder_ids = [f"D{i}" for i in range(150)]
+        listings = {
+            "root": [
+                {"id": fid, "name": fid, "mimeType": folder, "parents": ["root"]}
+                for fid in folder_ids
+            ],
+        }
+        service, batches = self._mock_service_with_batches(listings)
+
+        controller = GoogleDriveController.from_service(
+            service,
+            max_workers=2,
+            http_factory=object,
+        )
+        infos = controller.list_tree("root")
+
+        self.assertEqual(len(infos), 150)
+        self.assertEqual(sorted(len(ids) for ids, _ in batches), [50, 100])
+        self.assertTrue(all(http is not None for _, http in batches))
+
+    def test_move_with_known_parents_skips_get(self) -> None:
+        files_resource = FakeFiles(update=FakeRequest({"id": "F", "parents": ["NEW"]}))
+
+        controller = GoogleDriveController.from_service(FakeService(files_resource))
+        info = controller.move("F", "NEW", old_parents=["OLD1", "OLD2"])
+
+        self.assertNotIn("get", files_resource.kwargs)
+        kwargs = files_resource.kwargs["update"]
+        self.assertEqual(kwargs["addParents"], "NEW")
+        self.assertEqual(kwargs["removeParents"], "OLD1,OLD2")
+        self.assertEqual(info.parents, ["NEW"])
+
+    def test_apply_batch_returns_outcome_per_call(self) -> None:
+        service, batches = self._mock_service_with_batches(
+            {},
+            update=FakeRequest({"id": "F1", "name": "renamed", "mimeType": "text/plain"}),
+            delete=FakeRequest(_http_error(404)),
+        )
+
+        controller = GoogleDriveController.from_service(service)
+        outcomes = controller.apply_batch(
+            [("rename", ("F1", "renamed")), ("delete_permanently", ("F2",))]
+        )
 
-        service = Mock()
-        files_resource = Mock()
-        req = Mock()
+        self.assertEqual(len(batches), 1)
+        self.assertEqual(outcomes[0].name, "renamed")
+        self.assertIsInstance(outcomes[1], NotFoundError)
 
-        service.files.return_value = files_resource
-        files_resource.get.return_value = req
+    def test_transfer_many_uses_thread_http(self) -> None:
+        requests = []
 
-        resp = Mock()
-        resp.status = 404
-        resp.reason = "Not Found"
-        req.execute.side_effect = HttpError(resp=resp, content=b"{}")
+        def fake_create(**kwargs):
+            requests.append(FakeRequest({"id": kwargs["body"]["name"]}))
+            return requests[-1]
 
+        controller = GoogleDriveController.from_service(
+            FakeService(FakeFiles(create=fake_create)),
+            max_workers=2,
+            http_factory=object,
+        )
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = []
+            for name in ("a.txt", "b.txt"):
+                paths.append(os.path.join(tmp, name))
+                with open(paths[-1], "wb") as f:
+                    f.write(b"x")
+            outcomes = controller.transfer_many(
+                [("upload_file", (path, "P1", None)) for path in paths]
+            )
+
+        self.assertEqual({i: o.file_id for i, o in outcomes.items()}, {0: "a.txt", 1: "b.txt"})
+        # Each request was bound to a worker thread's own HTTP object.
+        self.assertTrue(all(type(req.http) is object for req in requests))
+
+    def test_upload_small_file_uses_simple_upload(self) -> None:
+        files_resource = FakeFiles(create=FakeRequest({"id": "U1"}))
+
+        controller = GoogleDriveController.from_service(FakeService(files_resource))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "small.txt")
+            with open(path, "wb") as f:
+                f.write(b"hello")
+            controller.upload_file(path, "P1")
+
+        media = files_resource.kwargs["create"]["media_body"]
+        self.assertFalse(media.resumable())
+
+    def test_get_maps_http_404_to_not_found(self) -> None:
+        service = FakeService(FakeFiles(get=FakeRequest(_http_error(404))))
         controller = GoogleDriveController.from_service(service)
 
         with self.assertRaises(NotFoundError):
             controller.get("X")
 
     def test_retry_on_429(self) -> None:
-        from googleapiclient.errors import HttpError
-
-        service = Mock()
-        files_resource = Mock()
-        req = Mock()
-
-        service.files.return_value = files_resource
-        files_resource.get.return_value = req
-
-        resp = Mock()
-        resp.status = 429
-        resp.reason = "rateLimitExceeded"
-        err_body = {
-            "error": {
-                "message": "rate limited",
-                "errors": [{"reason": "rateLimitExceeded"}],
-            }
-        }
-        http_err = HttpError(resp=resp, content=json.dumps(err_body).encode("utf-8"))
-
+        http_err = _http_error(429, _RATE_LIMIT_BODY)
         # Fail twice, then succeed.
-        req.execute.side_effect = [
+        req = FakeRequest(
             http_err,
             http_err,
             {"id": "F1", "name": "n", "mimeType": "text/plain", "parents": []},
-        ]
-
-        controller = GoogleDriveController.from_service(service)
+        )
+        controller = GoogleDriveController.from_service(FakeService(FakeFiles(get=req)))
 
-        with patch("time.sleep", return_value=None) as _:
-            info = controller.get("F1")
+        info = controller.get("F1")
 
         self.assertEqual(info.file_id, "F1")
-        self.assertEqual(req.execute.call_count, 3)
+        self.assertEqual(req.call_count, 3)
 
-    def test_map_429_to_rate_limit_error(self) -> None:
-        from googleapiclient.errors import HttpError
-
-        service = Mock()
-        files_resource = Mock()
-        req = Mock()
-
-        service.files.return_value = files_resource
-        files_resource.get.return_value = req
-
-        resp = Mock()
-        resp.status = 429
-        resp.reason = "rateLimitExceeded"
-        err_body = {
-            "error": {
-                "message": "rate limited",
-                "errors": [{"reason": "rateLimitExceeded"}],
-            }
-        }
-        http_err = HttpError(resp=resp, content=json.dumps(err_body).encode("utf-8"))
-        req.execute.side_effect = http_err
+    def test_retry_honors_retry_after(self) -> None:
+        req = FakeRequest(
+            _http_error(429, **{"retry-after": "7"}),
+            {"id": "F1", "name": "n", "mimeType": "text/plain", "parents": []},
+        )
+        controller = GoogleDriveController.from_service(FakeService(FakeFiles(get=req)))
 
-        controller = GoogleDriveController.from_service(service)
+        with patch("gdrivemgr.controller.drive_controller.time.sleep") as sleep:
+            controller.get("F1")
 
-        with patch("time.sleep", return_value=None):
-            with self.assertRaises(RateLimitError):
-                controller.get("X")
+        sleep.assert_called_once()
+        self.assertGreaterEqual(sleep.call_args.args[0], 7.0)
+
+    def test_map_429_to_rate_limit_error(self) -> None:
+        # Every attempt (initial + retries) is rate limited.
+        req = FakeRequest(*[_http_error(429, _RATE_LIMIT_BODY)] * 4)
+        controller = GoogleDriveController.from_service(FakeService(FakeFiles(get=req)))
+
+        with self.assertRaises(RateLimitError):
+            controller.get("X")
 
 
 if __name__ == "__main__":
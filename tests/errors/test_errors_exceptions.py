@@ -14,6 +14,22 @@ from gdrivemgr.errors.exceptions import (
     map_http_error,
 )
 
+_MAP_CASES = [
+    (HttpErrorInfo(status_code=400, message="x"), InvalidArgumentError),
+    (HttpErrorInfo(status_code=401, message="x"), AuthError),
+    (HttpErrorInfo(status_code=403, reason="quotaExceeded", message="x"), QuotaExceededError),
+    (
+        HttpErrorInfo(status_code=403, reason="insufficientPermissions", message="x"),
+        PermissionError,
+    ),
+    (HttpErrorInfo(status_code=404, message="x"), NotFoundError),
+    (HttpErrorInfo(status_code=409, message="x"), ConflictError),
+    (HttpErrorInfo(status_code=412, message="x"), ConflictError),
+    (HttpErrorInfo(status_code=429, message="x"), RateLimitError),
+    (HttpErrorInfo(status_code=503, message="x"), ApiError),
+    (HttpErrorInfo(status_code=418, message="x"), ApiError),
+]
+
 
 class TestExceptions(unittest.TestCase):
     def test_base_error_keeps_details_and_cause(self) -> None:
@@ -23,40 +39,10 @@ class TestExceptions(unittest.TestCase):
         self.assertEqual(err.details["k"], "v")
         self.assertIs(err.cause, cause)
 
-    def test_map_http_error_basic(self) -> None:
-        err = map_http_error(HttpErrorInfo(status_code=404, message="not found"))
-        self.assertIsInstance(err, NotFoundError)
-
-        err = map_http_error(HttpErrorInfo(status_code=400, message="bad req"))
-        self.assertIsInstance(err, InvalidArgumentError)
-
-        err = map_http_error(HttpErrorInfo(status_code=429, message="rate"))
-        self.assertIsInstance(err, RateLimitError)
-
-        err = map_http_error(HttpErrorInfo(status_code=409, message="conflict"))
-        self.assertIsInstance(err, ConflictError)
-
-        err = map_http_error(HttpErrorInfo(status_code=401, message="auth"))
-        self.assertIsInstance(err, AuthError)
-
-    def test_map_http_error_403_quota_vs_permission(self) -> None:
-        err = map_http_error(
-            HttpErrorInfo(status_code=403, reason="quotaExceeded", message="quota")
-        )
-        self.assertIsInstance(err, QuotaExceededError)
-
-        err = map_http_error(
-            HttpErrorInfo(status_code=403, reason="insufficientPermissions", message="x")
-        )
-        self.assertIsInstance(err, PermissionError)
-
-    def test_map_http_error_5xx_is_api_error(self) -> None:
-        err = map_http_error(HttpErrorInfo(status_code=503, message="unavail"))
-        self.assertIsInstance(err, ApiError)
-
-    def test_map_http_error_other_is_api_error(self) -> None:
-        err = map_http_error(HttpErrorInfo(status_code=418, message="teapot"))
-        self.assertIsInstance(err, ApiError)
+    def test_map_http_error_maps_status_and_reason(self) -> None:
+        for info, expected in _MAP_CASES:
+            with self.subTest(status=info.status_code, reason=info.reason):
+                self.assertIsInstance(map_http_error(info), expected)
 
 
 if __name__ == "__main__":
@@ -3,13 +3,17 @@ from datetime import datetime, timezone
 
 from gdrivemgr.errors import LocalValidationError
 from gdrivemgr.local import GoogleDriveLocal
+from gdrivemgr.local.snapshot import DriveSnapshot
 from gdrivemgr.models import FileInfo
 from gdrivemgr.plan import Action
 from gdrivemgr.util.mime import FOLDER_MIME
 
 
 class TestGoogleDriveLocal(unittest.TestCase):
-    def _make_local(self) -> GoogleDriveLocal:
+    @classmethod
+    def setUpClass(cls) -> None:
+        # Built once: GoogleDriveLocal takes a copy-on-write clone of the
+        # snapshot, so every test can start from this shared one.
         root = FileInfo(
             local_id="root",
             file_id="root",
@@ -39,7 +43,10 @@ class TestGoogleDriveLocal(unittest.TestCase):
             parents=["A"],
             modified_time=datetime(2025, 1, 1, tzinfo=timezone.utc),
         )
-        return GoogleDriveLocal.from_file_infos("root", [root, a, b, f])
+        cls._snapshot = DriveSnapshot.from_file_infos((root, a, b, f))
+
+    def _make_local(self) -> GoogleDriveLocal:
+        return GoogleDriveLocal("root", self._snapshot)
 
     def test_create_folder_and_op(self) -> None:
         local = self._make_local()
@@ -65,6 +72,30 @@ class TestGoogleDriveLocal(unittest.TestCase):
         with self.assertRaises(LocalValidationError):
             local.move("A", "B")
 
+    def test_cycle_through_multi_parent_ancestor_rejected(self) -> None:
+        def folder(local_id: str, *parents: str) -> FileInfo:
+            return FileInfo(
+                local_id=local_id,
+                file_id=local_id,
+                name=local_id,
+                mime_type=FOLDER_MIME,
+                parents=list(parents),
+            )
+
+        local = GoogleDriveLocal.from_file_infos(
+            "root",
+            [
+                folder("root"),
+                folder("A", "root"),
+                folder("D", "root"),
+                folder("M", "D", "A"),
+                folder("N", "M"),
+            ],
+        )
+        with self.assertRaises(LocalValidationError):
+            local.move("A", "N")
+        local.move("D", "A")  # D -> A is fine (A is not below D)
+
     def test_multi_parent_move_rejected(self) -> None:
         root = FileInfo(
             local_id="root",
@@ -125,6 +156,18 @@ class TestGoogleDriveLocal(unittest.TestCase):
         self.assertIsNotNone(op.precondition)
         self.assertIn("expected_modified_time", op.precondition)
 
+    def test_find_by_name_whole_scope_tracks_renames(self) -> None:
+        local = self._make_local()
+        new_id = local.create_folder("file.txt", "B")
+        self.assertEqual(
+            [i.local_id for i in local.find_by_name("file.txt")],
+            sorted(["F", new_id]),
+        )
+
+        local.rename("F", "other.txt")
+        self.assertEqual([i.local_id for i in local.find_by_name("file.txt")], [new_id])
+        self.assertEqual([i.local_id for i in local.find_by_name("other.txt")], ["F"])
+
     def test_clear_ops_resets_state(self) -> None:
         local = self._make_local()
         local.rename("F", "x.txt")
@@ -133,6 +176,20 @@ class TestGoogleDriveLocal(unittest.TestCase):
         self.assertEqual(local.get("F").name, "file.txt")
         self.assertEqual(len(local.list_ops()), 0)
 
+    def test_clear_ops_restores_indexes_after_move_and_trash(self) -> None:
+        local = self._make_local()
+        local.move("F", "root")
+        local.trash("B")
+        self.assertNotIn("F", [i.local_id for i in local.list_children("A")])
+        self.assertTrue(local.get("B").trashed)
+
+        local.clear_ops()
+
+        self.assertEqual([i.local_id for i in local.list_children("A")], ["B", "F"])
+        self.assertEqual(local.get("F").parents, ["A"])
+        self.assertFalse(local.get("B").trashed)
+        self.assertEqual(local.find_by_name("file.txt", "root"), [])
+
 
 if __name__ == "__main__":
     unittest.main()
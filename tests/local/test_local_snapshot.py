@@ -0,0 +1,93 @@
+import unittest
+from dataclasses import fields
+from datetime import datetime, timezone
+
+from gdrivemgr.local.snapshot import DriveSnapshot, _copy_file_info
+from gdrivemgr.models import FileInfo
+from gdrivemgr.util.mime import FOLDER_MIME
+
+
+def _folder(local_id: str, *parents: str) -> FileInfo:
+    return FileInfo(
+        local_id=local_id,
+        file_id=local_id,
+        name=local_id,
+        mime_type=FOLDER_MIME,
+        parents=list(parents),
+    )
+
+
+class TestDriveSnapshot(unittest.TestCase):
+    def _make_snapshot(self) -> DriveSnapshot:
+        # root -> A -> B -> C, root -> D
+        return DriveSnapshot.from_file_infos(
+            [
+                _folder("root"),
+                _folder("A", "root"),
+                _folder("B", "A"),
+                _folder("C", "B"),
+                _folder("D", "root"),
+            ]
+        )
+
+    def test_depth_map_is_maintained_incrementally(self) -> None:
+        snap = self._make_snapshot()
+        self.assertEqual(snap.depth_map("root")["C"], 3)
+
+        snap.replace_parent("B", "D")
+        snap.add_file(_folder("E", "C"))
+        snap.replace_parent("A", "C")
+
+        cached = snap.depth_map("root")
+        self.assertEqual(cached, snap._compute_depths("root"))
+        self.assertEqual(cached["E"], 4)
+        self.assertEqual(cached["A"], 4)
+
+    def test_depth_map_recomputes_for_multi_parent_subtree(self) -> None:
+        snap = self._make_snapshot()
+        snap.add_file(_folder("M", "C", "D"))
+        snap.depth_map("root")
+
+        # M stays reachable through D, so its depth is not C's depth + 1.
+        snap.replace_parent("C", "A")
+        self.assertEqual(snap.depth_map("root"), snap._compute_depths("root"))
+        self.assertEqual(snap.depth_map("root")["M"], 2)
+
+    def test_clone_is_isolated(self) -> None:
+        base = self._make_snapshot()
+        clone = base.clone()
+
+        clone.rename("C", "renamed")
+        clone.replace_parent("C", "root")
+        clone.set_trashed("D")
+
+        self.assertEqual(base.get("C").name, "C")
+        self.assertEqual(base.get("C").parents, ["B"])
+        self.assertFalse(base.get("D").trashed)
+        self.assertEqual(base.list_children_ids("B"), ["C"])
+        self.assertIn("C", base.name_index_by_parent_local_id["B"])
+        self.assertEqual(list(clone.name_index_by_parent_local_id["root"]["renamed"]), ["C"])
+
+    def test_copy_file_info_copies_every_field(self) -> None:
+        dt = datetime(2025, 1, 1, tzinfo=timezone.utc)
+        info = FileInfo(
+            local_id="F",
+            file_id="F",
+            name="f",
+            mime_type="text/plain",
+            parents=["P"],
+            trashed=True,
+            modified_time=dt,
+            created_time=dt,
+            size=1,
+            md5_checksum="x",
+        )
+        copied = _copy_file_info(info)
+
+        for f in fields(FileInfo):
+            self.assertEqual(getattr(copied, f.name), getattr(info, f.name), f.name)
+        self.assertIsNot(copied.parents, info.parents)
+
+
+if __name__ == "__main__":
+    unittest.main()
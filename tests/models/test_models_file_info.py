@@ -38,6 +38,17 @@ class TestFileInfo(unittest.TestCase):
         self.assertEqual(info.size, 123)
         self.assertEqual(info.md5_checksum, "abc")
 
+    def test_file_info_is_folder_derived_from_mime_type(self) -> None:
+        folder = FileInfo(
+            local_id="D1",
+            name="d",
+            mime_type="application/vnd.google-apps.folder",
+            parents=[],
+        )
+        doc = FileInfo(local_id="F1", name="f", mime_type="text/plain", parents=[])
+        self.assertTrue(folder.is_folder)
+        self.assertFalse(doc.is_folder)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -20,6 +20,22 @@ class TestPlanOperation(unittest.TestCase):
         with self.assertRaises(ValueError):
             op.validate_required_fields()
 
+    def test_clone_copies_precondition(self) -> None:
+        op = PlanOperation(
+            op_id="o1",
+            seq=0,
+            action=Action.RENAME,
+            target_local_id="t",
+            name="n",
+            precondition={"expected_modified_time": None},
+        )
+        cloned = op.clone()
+        cloned.precondition["extra"] = 1  # type: ignore[index]
+
+        self.assertEqual(cloned.op_id, "o1")
+        self.assertEqual(cloned.name, "n")
+        self.assertNotIn("extra", op.precondition)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -2,6 +2,12 @@ import unittest
 
 from gdrivemgr.plan import Action, PlanOperation, build_apply_order
 
+# build_apply_order only reads its input, so tests can share these.
+_DELETE_BLOCK = [
+    PlanOperation(op_id="d1", seq=0, action=Action.TRASH, target_local_id="p"),
+    PlanOperation(op_id="d2", seq=1, action=Action.DELETE_PERMANENT, target_local_id="c"),
+]
+
 
 class TestOrdering(unittest.TestCase):
     def test_build_apply_order_seq_default(self) -> None:
@@ -14,36 +20,11 @@ class TestOrdering(unittest.TestCase):
         self.assertEqual(order, ["c", "b", "a"])
 
     def test_delete_block_reordered_by_depth(self) -> None:
-        ops = [
-            PlanOperation(
-                op_id="d1",
-                seq=0,
-                action=Action.TRASH,
-                target_local_id="parent",
-            ),
-            PlanOperation(
-                op_id="d2",
-                seq=1,
-                action=Action.DELETE_PERMANENT,
-                target_local_id="child",
-            ),
-        ]
-        depth = {"parent": 1, "child": 2}
-        order = build_apply_order(ops, depth_by_local_id=depth)
+        order = build_apply_order(_DELETE_BLOCK, depth_by_local_id={"p": 1, "c": 2})
         self.assertEqual(order, ["d2", "d1"])
 
     def test_delete_block_not_reordered_if_missing_depth(self) -> None:
-        ops = [
-            PlanOperation(op_id="d1", seq=0, action=Action.TRASH, target_local_id="p"),
-            PlanOperation(
-                op_id="d2",
-                seq=1,
-                action=Action.DELETE_PERMANENT,
-                target_local_id="c",
-            ),
-        ]
-        depth = {"p": 1}
-        order = build_apply_order(ops, depth_by_local_id=depth)
+        order = build_apply_order(_DELETE_BLOCK, depth_by_local_id={"p": 1})
         self.assertEqual(order, ["d1", "d2"])
 
     def test_reorder_only_within_contiguous_delete_block(self) -> None:
@@ -62,6 +43,19 @@ class TestOrdering(unittest.TestCase):
         # Not contiguous, so no swap occurs.
         self.assertEqual(order, ["d1", "x1", "d2"])
 
+    def test_each_delete_block_reordered_independently(self) -> None:
+        ops = [
+            PlanOperation(op_id="x1", seq=4, action=Action.RENAME, target_local_id="t"),
+            PlanOperation(op_id="d1", seq=2, action=Action.TRASH, target_local_id="p"),
+            PlanOperation(op_id="d2", seq=3, action=Action.TRASH, target_local_id="c"),
+            PlanOperation(op_id="d3", seq=5, action=Action.TRASH, target_local_id="q"),
+            PlanOperation(op_id="d4", seq=6, action=Action.TRASH, target_local_id="r"),
+            PlanOperation(op_id="d5", seq=7, action=Action.TRASH, target_local_id="s"),
+        ]
+        depth = {"p": 1, "c": 2, "q": 1, "r": 3, "s": 3}
+        order = build_apply_order(ops, depth_by_local_id=depth)
+        self.assertEqual(order, ["d2", "d1", "x1", "d4", "d5", "d3"])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -10,32 +10,34 @@ from gdrivemgr.plan import (
     check_modified_time_precondition,
 )
 
+_DT = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
+# Only read by apply_default_preconditions, so tests can share it.
+_FILES = {
+    "t1": FileInfo(
+        local_id="t1",
+        file_id="t1",
+        name="x",
+        mime_type="text/plain",
+        parents=["root"],
+        modified_time=_DT,
+    )
+}
+
 
 class TestPreconditions(unittest.TestCase):
     def test_apply_default_preconditions_sets_expected_modified_time(self) -> None:
-        dt = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        files = {
-            "t1": FileInfo(
-                local_id="t1",
-                file_id="t1",
-                name="x",
-                mime_type="text/plain",
-                parents=["root"],
-                modified_time=dt,
-            )
-        }
         ops = [
             PlanOperation(op_id="o1", seq=0, action=Action.RENAME, target_local_id="t1")
         ]
-        apply_default_preconditions(ops, files)
+        apply_default_preconditions(ops, _FILES)
         self.assertIsNotNone(ops[0].precondition)
         self.assertIn("expected_modified_time", ops[0].precondition)
 
     def test_check_modified_time_precondition(self) -> None:
-        expected = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
-        pre = {"expected_modified_time": expected}
+        pre = {"expected_modified_time": _DT}
 
-        check_modified_time_precondition(pre, expected)
+        check_modified_time_precondition(pre, _DT)
 
         different = datetime(2025, 1, 1, 0, 0, 1, tzinfo=timezone.utc)
         with self.assertRaises(ConflictError):
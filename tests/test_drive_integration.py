@@ -1,5 +1,6 @@
 import argparse
 import os
+import shutil
 import tempfile
 import unittest
 from pathlib import Path
@@ -10,13 +11,21 @@ from gdrivemgr import AuthInfo, GoogleDriveManager
 DEFAULT_SCOPES = ("https://www.googleapis.com/auth/drive",)
 
 
+_REQUIRED_ENV = (
+    "GDRIVEMGR_CLIENT_SECRETS",
+    "GDRIVEMGR_TOKEN_FILE",
+    "GDRIVEMGR_TEST_ROOT_ID",
+)
+
+
 def _env(name: str) -> str:
-    value = os.environ.get(name, "").strip()
-    if not value:
-        raise RuntimeError(f"Missing env var: {name}")
-    return value
+    return os.environ.get(name, "").strip()
 
 
+@unittest.skipUnless(
+    all(_env(name) for name in _REQUIRED_ENV),
+    "Set " + ", ".join(_REQUIRED_ENV) + " to run the Drive integration tests",
+)
 class TestGoogleDriveIntegration(unittest.TestCase):
     """
     Integration test with real Google Drive.
@@ -36,7 +45,7 @@ class TestGoogleDriveIntegration(unittest.TestCase):
         cls.token_file = _env("GDRIVEMGR_TOKEN_FILE")
         cls.root_id = _env("GDRIVEMGR_TEST_ROOT_ID")
 
-        scopes_raw = os.environ.get("GDRIVEMGR_SCOPES", "").strip()
+        scopes_raw = _env("GDRIVEMGR_SCOPES")
         if scopes_raw:
             cls.scopes = tuple(s.strip() for s in scopes_raw.split(",") if s.strip())
         else:
@@ -50,6 +59,15 @@ class TestGoogleDriveIntegration(unittest.TestCase):
             },
         )
 
+        # One small source file shared by both tests; uploads only read it.
+        cls.tmp_path = Path(tempfile.mkdtemp())
+        cls.src_file = cls.tmp_path / "hello.txt"
+        cls.src_file.write_bytes(b"hello from gdrivemgr integration test\n")
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        shutil.rmtree(cls.tmp_path, ignore_errors=True)
+
     def test_plan_apply_smoke(self) -> None:
         mgr = GoogleDriveManager(self.auth_info, scopes=self.scopes)
 
@@ -59,34 +77,28 @@ class TestGoogleDriveIntegration(unittest.TestCase):
         # 2) Local操作（テスト用フォルダ配下でのみ）
         test_folder_id = local.create_folder("gdrivemgr_it_tmp", self.root_id)
 
-        # 作業用の小さなローカルファイルを作る
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            src_file = tmp_path / "hello.txt"
-            src_file.write_text("hello from gdrivemgr integration test\n", encoding="utf-8")
-
-            # upload -> rename -> copy -> move -> download -> trash
-            uploaded_id = local.upload_file(str(src_file), test_folder_id)
-            local.rename(uploaded_id, "hello_renamed.txt")
+        # upload -> rename -> copy -> move -> download -> trash
+        uploaded_id = local.upload_file(str(self.src_file), test_folder_id)
+        local.rename(uploaded_id, "hello_renamed.txt")
 
-            copied_id = local.copy(uploaded_id, test_folder_id, new_name="hello_copy.txt")
-            local.move(copied_id, test_folder_id)
+        copied_id = local.copy(uploaded_id, test_folder_id, new_name="hello_copy.txt")
+        local.move(copied_id, test_folder_id)
 
-            dst_file = tmp_path / "downloaded.txt"
-            local.download_file(uploaded_id, str(dst_file), overwrite=True)
+        dst_file = self.tmp_path / "downloaded.txt"
+        local.download_file(uploaded_id, str(dst_file), overwrite=True)
 
-            # 安全側：trash（永久削除はデフォルトで行わない）
-            local.trash(uploaded_id)
-            local.trash(copied_id)
-            local.trash(test_folder_id)
+        # 安全側：trash（永久削除はデフォルトで行わない）
+        local.trash(uploaded_id)
+        local.trash(copied_id)
+        local.trash(test_folder_id)
 
-            # 3) plan作成（確認用に内容を出す）
-            plan = mgr.build_plan()
-            self.assertEqual(plan.remote_root_id, self.root_id)
-            self.assertGreaterEqual(len(plan.operations), 1)
+        # 3) plan作成（確認用に内容を出す）
+        plan = mgr.build_plan()
+        self.assertEqual(plan.remote_root_id, self.root_id)
+        self.assertGreaterEqual(len(plan.operations), 1)
 
-            # 4) apply
-            result = mgr.apply_plan(plan)
+        # 4) apply
+        result = mgr.apply_plan(plan)
 
         # 5) 結果
         self.assertIn(result.status, ("success", "failed"))
@@ -100,8 +112,7 @@ class TestGoogleDriveIntegration(unittest.TestCase):
 
         Enabled only when env GDRIVEMGR_DANGER_DELETE=1 is set.
         """
-        danger = os.environ.get("GDRIVEMGR_DANGER_DELETE", "").strip() == "1"
-        if not danger:
+        if _env("GDRIVEMGR_DANGER_DELETE") != "1":
             self.skipTest("Set GDRIVEMGR_DANGER_DELETE=1 to enable permanent delete test")
 
         mgr = GoogleDriveManager(self.auth_info, scopes=self.scopes)
@@ -109,20 +120,15 @@ class TestGoogleDriveIntegration(unittest.TestCase):
 
         test_folder_id = local.create_folder("gdrivemgr_it_delete_tmp", self.root_id)
 
-        with tempfile.TemporaryDirectory() as tmp:
-            tmp_path = Path(tmp)
-            src_file = tmp_path / "delete_me.txt"
-            src_file.write_text("delete me\n", encoding="utf-8")
-
-            uploaded_id = local.upload_file(str(src_file), test_folder_id)
-            # trash -> delete_permanently（作成物のみ対象）
-            local.trash(uploaded_id)
-            local.delete_permanently(uploaded_id)
-            local.trash(test_folder_id)
-            local.delete_permanently(test_folder_id)
+        uploaded_id = local.upload_file(str(self.src_file), test_folder_id, name="delete_me.txt")
+        # trash -> delete_permanently（作成物のみ対象）
+        local.trash(uploaded_id)
+        local.delete_permanently(uploaded_id)
+        local.trash(test_folder_id)
+        local.delete_permanently(test_folder_id)
 
-            plan = mgr.build_plan()
-            result = mgr.apply_plan(plan)
+        plan = mgr.build_plan()
+        result = mgr.apply_plan(plan)
 
         self.assertIn(result.status, ("success", "failed"))
 
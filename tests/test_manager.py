@@ -1,16 +1,24 @@
 import unittest
 from datetime import datetime, timezone
 
-from gdrivemgr.errors import InvalidStateError, NotFoundError
+from gdrivemgr.errors import (
+    GDriveMgrError,
+    InvalidArgumentError,
+    InvalidStateError,
+    NotFoundError,
+)
 from gdrivemgr.manager import GoogleDriveManager
 from gdrivemgr.models import FileInfo
 from gdrivemgr.util.mime import FOLDER_MIME
 
+_DT = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+
 
 class FakeController:
     def __init__(self) -> None:
         self.calls = []
-        self.dt = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
+        self.call_set = set()
+        self.dt = _DT
 
         self.root = FileInfo(
             local_id="root",
@@ -34,50 +42,42 @@ class FakeController:
             parents=["A"],
             modified_time=self.dt,
         )
+        self._by_id = {"root": self.root, "A": self.a, "F": self.f}
 
     def get(self, file_id: str) -> FileInfo:
-        self.calls.append(("get", file_id))
-        if file_id == "root":
-            return self.root
-        if file_id == "F":
-            return self.f
-        if file_id == "A":
-            return self.a
-        # created folder ids:
-        if file_id == "NF1":
-            return FileInfo(
-                local_id="NF1",
-                file_id="NF1",
-                name="NEW",
-                mime_type=FOLDER_MIME,
-                parents=["root"],
-            )
-        raise NotFoundError("not found", details={"file_id": file_id})
-
-    def list_tree(self, root_id: str, include_trashed: bool = False):
-        self.calls.append(("list_tree", root_id, include_trashed))
+        self._record("get", file_id)
+        try:
+            return self._by_id[file_id]
+        except KeyError:
+            raise NotFoundError("not found", details={"file_id": file_id}) from None
+
+    def list_tree(self, root_id: str, include_trashed: bool = False, full_metadata: bool = True):
+        self._record("list_tree", root_id, include_trashed)
         return [self.a, self.f]
 
     def create_folder(self, name: str, parent_id: str) -> FileInfo:
-        self.calls.append(("create_folder", name, parent_id))
-        return FileInfo(
+        self._record("create_folder", name, parent_id)
+        info = FileInfo(
             local_id="NF1",
             file_id="NF1",
             name=name,
             mime_type=FOLDER_MIME,
             parents=[parent_id],
         )
+        self._by_id["NF1"] = info
+        return info
 
-    def move(self, file_id: str, new_parent_id: str) -> FileInfo:
-        self.calls.append(("move", file_id, new_parent_id))
+    def move(self, file_id: str, new_parent_id: str, old_parents=None) -> FileInfo:
+        self._record("move", file_id, new_parent_id)
+        self.move_old_parents = old_parents
         return self.get(file_id)
 
     def rename(self, file_id: str, new_name: str) -> FileInfo:
-        self.calls.append(("rename", file_id, new_name))
+        self._record("rename", file_id, new_name)
         return self.get(file_id)
 
     def copy(self, file_id: str, new_parent_id: str, new_name=None) -> FileInfo:
-        self.calls.append(("copy", file_id, new_parent_id, new_name))
+        self._record("copy", file_id, new_parent_id, new_name)
         return FileInfo(
             local_id="CP1",
             file_id="CP1",
@@ -87,13 +87,13 @@ class FakeController:
         )
 
     def trash(self, file_id: str) -> None:
-        self.calls.append(("trash", file_id))
+        self._record("trash", file_id)
 
     def delete_permanently(self, file_id: str) -> None:
-        self.calls.append(("delete_permanently", file_id))
+        self._record("delete_permanently", file_id)
 
     def upload_file(self, local_path: str, parent_id: str, name=None) -> FileInfo:
-        self.calls.append(("upload_file", local_path, parent_id, name))
+        self._record("upload_file", local_path, parent_id, name)
         return FileInfo(
             local_id="UP1",
             file_id="UP1",
@@ -103,7 +103,28 @@ class FakeController:
         )
 
     def download_file(self, file_id: str, local_path: str, overwrite: bool = False) -> None:
-        self.calls.append(("download_file", file_id, local_path, overwrite))
+        self._record("download_file", file_id, local_path, overwrite)
+
+    def apply_batch(self, calls):
+        self._record("apply_batch", tuple(method for method, _ in calls))
+        return self._run_calls(calls)
+
+    def transfer_many(self, calls):
+        self._record("transfer_many", tuple(method for method, _ in calls))
+        return dict(enumerate(self._run_calls(calls)))
+
+    def _record(self, *call) -> None:
+        self.calls.append(call)
+        self.call_set.add(call)
+
+    def _run_calls(self, calls):
+        outcomes = []
+        for method, args in calls:
+            try:
+                outcomes.append(getattr(self, method)(*args))
+            except GDriveMgrError as exc:
+                outcomes.append(exc)
+        return outcomes
 
 
 class TestGoogleDriveManager(unittest.TestCase):
@@ -124,7 +145,24 @@ class TestGoogleDriveManager(unittest.TestCase):
         self.assertEqual(result.id_map[new_folder_local_id], "NF1")
 
         # Ensure move called with resolved file id and resolved new parent id.
-        self.assertIn(("move", "F", "NF1"), controller.calls)
+        self.assertIn(("move", "F", "NF1"), controller.call_set)
+        # Parents come from the precondition get; no extra lookup is needed.
+        self.assertEqual(controller.move_old_parents, ["A"])
+
+    def test_apply_without_auto_refresh_reloads_on_next_access(self) -> None:
+        controller = FakeController()
+        mgr = GoogleDriveManager.from_controller(controller, auto_refresh=False)
+
+        local = mgr.open("root")
+        local.rename("F", "renamed.txt")
+        result = mgr.apply_plan(mgr.build_plan())
+
+        self.assertEqual(result.status, "success")
+        self.assertFalse(result.snapshot_refreshed)
+        self.assertEqual(sum(call[0] == "list_tree" for call in controller.calls), 1)
+
+        mgr.local.get("F")
+        self.assertEqual(sum(call[0] == "list_tree" for call in controller.calls), 2)
 
     def test_apply_root_mismatch_is_fatal(self) -> None:
         controller = FakeController()
@@ -137,6 +175,20 @@ class TestGoogleDriveManager(unittest.TestCase):
         with self.assertRaises(InvalidStateError):
             mgr.apply_plan(plan)
 
+    def test_apply_unknown_op_id_is_fatal(self) -> None:
+        controller = FakeController()
+        mgr = GoogleDriveManager.from_controller(controller)
+
+        local = mgr.open("root")
+        local.rename("F", "renamed.txt")
+        plan = mgr.build_plan()
+        plan.apply_order.append("missing")
+
+        with self.assertRaises(InvalidArgumentError) as cm:
+            mgr.apply_plan(plan)
+        self.assertEqual(cm.exception.details["op_id"], "missing")
+        self.assertNotIn(("rename", "F", "renamed.txt"), controller.call_set)
+
     def test_apply_nonfatal_error_returns_failed(self) -> None:
         controller = FakeController()
         mgr = GoogleDriveManager.from_controller(controller)
@@ -146,7 +198,7 @@ class TestGoogleDriveManager(unittest.TestCase):
         local.move("F", new_folder_local_id)
 
         # Make controller.move fail (non-fatal).
-        def bad_move(file_id: str, new_parent_id: str):
+        def bad_move(file_id: str, new_parent_id: str, old_parents=None):
             raise NotFoundError("not found")
 
         controller.move = bad_move  # type: ignore[assignment]
@@ -158,6 +210,87 @@ class TestGoogleDriveManager(unittest.TestCase):
         self.assertIsNotNone(result.stopped_op_id)
         self.assertGreaterEqual(result.summary.get("failed", 0), 1)
 
+    def test_apply_batch_groups_independent_ops(self) -> None:
+        controller = FakeController()
+        mgr = GoogleDriveManager.from_controller(controller)
+
+        local = mgr.open("root")
+        new_folder_local_id = local.create_folder("NEW", "root")
+        local.rename("F", "renamed.txt")
+        # Depends on both ops above, so it cannot join their batch.
+        local.move("F", new_folder_local_id)
+
+        result = mgr.apply_plan(mgr.build_plan(), batch=True)
+
+        self.assertEqual(result.status, "success")
+        self.assertEqual(result.id_map[new_folder_local_id], "NF1")
+        self.assertEqual([r.action for r in result.results], ["CREATE_FOLDER", "RENAME", "MOVE"])
+        # The rename's precondition get goes out as its own batch first.
+        self.assertIn(("apply_batch", ("get",)), controller.call_set)
+        self.assertIn(("apply_batch", ("create_folder", "rename")), controller.call_set)
+        self.assertIn(("move", "F", "NF1"), controller.call_set)
+
+    def test_apply_batch_stops_after_failing_batch(self) -> None:
+        controller = FakeController()
+        mgr = GoogleDriveManager.from_controller(controller)
+
+        local = mgr.open("root")
+        new_folder_local_id = local.create_folder("NEW", "root")
+        local.rename("F", "renamed.txt")
+        local.move("F", new_folder_local_id)
+
+        def bad_rename(file_id: str, new_name: str):
+            raise NotFoundError("not found")
+
+        controller.rename = bad_rename  # type: ignore[assignment]
+
+        plan = mgr.build_plan()
+        result = mgr.apply_plan(plan, batch=True)
+
+        self.assertEqual(result.status, "failed")
+        self.assertEqual(result.stopped_op_id, plan.apply_order[1])
+        self.assertEqual([r.status for r in result.results], ["success", "failed"])
+        self.assertNotIn(("move", "F", "NF1"), controller.call_set)
+
+    def test_apply_batch_precondition_conflict_sends_nothing(self) -> None:
+        controller = FakeController()
+        mgr = GoogleDriveManager.from_controller(controller)
+
+        local = mgr.open("root")
+        local.rename("F", "renamed.txt")
+        local.create_folder("NEW", "root")
+        plan = mgr.build_plan()
+
+        # F changed on Drive after the snapshot was taken.
+        controller.f.modified_time = datetime(2025, 2, 1, tzinfo=timezone.utc)
+        result = mgr.apply_plan(plan, batch=True)
+
+        self.assertEqual(result.status, "failed")
+        self.assertEqual(result.stopped_op_id, plan.apply_order[0])
+        self.assertEqual([r.error_type for r in result.results], ["ConflictError"])
+        self.assertFalse(any(call[0] == "create_folder" for call in controller.calls))
+
+    def test_apply_batch_groups_independent_transfers(self) -> None:
+        controller = FakeController()
+        mgr = GoogleDriveManager.from_controller(controller)
+
+        local = mgr.open("root")
+        up1 = local.upload_file("/tmp/a.txt", "A")
+        local.upload_file("/tmp/b.txt", "A")
+        local.download_file("F", "/tmp/f.txt")
+        # Same destination as the download above: must wait for it.
+        local.download_file("F", "/tmp/f.txt", overwrite=True)
+
+        result = mgr.apply_plan(mgr.build_plan(), batch=True)
+
+        self.assertEqual(result.status, "success")
+        self.assertEqual(result.id_map[up1], "UP1")
+        self.assertIn(
+            ("transfer_many", ("upload_file", "upload_file", "download_file")),
+            controller.call_set,
+        )
+        self.assertIn(("download_file", "F", "/tmp/f.txt", True), controller.call_set)
+
 
 if __name__ == "__main__":
     unittest.main()
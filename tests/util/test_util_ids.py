@@ -26,6 +26,15 @@ class TestUtilIds(unittest.TestCase):
         parsed = uuid.UUID(value)
         self.assertEqual(parsed.version, 4)
 
+    def test_new_uuid_has_rfc4122_variant(self) -> None:
+        for _ in range(100):
+            self.assertEqual(uuid.UUID(new_uuid()).variant, uuid.RFC_4122)
+
     def test_ids_are_unique(self) -> None:
         values = {new_uuid(), new_uuid(), new_uuid()}
         self.assertEqual(len(values), 3)
+
+    def test_ids_stay_valid_and_unique_across_pool_refills(self) -> None:
+        values = [new_uuid() for _ in range(1000)]
+        self.assertEqual(len(set(values)), len(values))
+        self.assertTrue(all(uuid.UUID(v).version == 4 for v in values))
@@ -1,5 +1,5 @@
 import unittest
-from datetime import datetime, timezone
+from datetime import datetime, timedelta, timezone
 
 from gdrivemgr.util.time import (
     normalize_dt,
@@ -9,6 +9,14 @@ from gdrivemgr.util.time import (
     to_rfc3339,
 )
 
+_PARSE_CASES = (
+    ("2025-01-01T12:34:56Z", "2025-01-01T12:34:56+00:00"),
+    ("2025-01-01T12:34:56.123456Z", "2025-01-01T12:34:56.123456+00:00"),
+    ("2025-01-01T12:34:56+00:00", "2025-01-01T12:34:56+00:00"),
+    # 12:34:56 JST == 03:34:56 UTC
+    ("2025-01-01T12:34:56+09:00", "2025-01-01T03:34:56+00:00"),
+)
+
 
 class TestUtilTime(unittest.TestCase):
     def test_now_utc_is_tz_aware(self) -> None:
@@ -21,23 +29,12 @@ class TestUtilTime(unittest.TestCase):
         with self.assertRaises(ValueError):
             normalize_dt(naive)
 
-    def test_parse_rfc3339_z(self) -> None:
-        dt = parse_rfc3339("2025-01-01T12:34:56Z")
-        self.assertEqual(dt.tzinfo, timezone.utc)
-        self.assertEqual(dt, datetime(2025, 1, 1, 12, 34, 56, tzinfo=timezone.utc))
-
-    def test_parse_rfc3339_fractional_z(self) -> None:
-        dt = parse_rfc3339("2025-01-01T12:34:56.123456Z")
-        self.assertEqual(dt.tzinfo, timezone.utc)
-        self.assertEqual(
-            dt, datetime(2025, 1, 1, 12, 34, 56, 123456, tzinfo=timezone.utc)
-        )
-
-    def test_parse_rfc3339_offset_converts_to_utc(self) -> None:
-        dt = parse_rfc3339("2025-01-01T12:34:56+09:00")
-        self.assertEqual(dt.tzinfo, timezone.utc)
-        # 12:34:56 JST == 03:34:56 UTC
-        self.assertEqual(dt, datetime(2025, 1, 1, 3, 34, 56, tzinfo=timezone.utc))
+    def test_parse_rfc3339_returns_utc(self) -> None:
+        for value, expected in _PARSE_CASES:
+            with self.subTest(value=value):
+                dt = parse_rfc3339(value)
+                self.assertEqual(dt.tzinfo, timezone.utc)
+                self.assertEqual(dt.isoformat(), expected)
 
     def test_to_rfc3339_outputs_z(self) -> None:
         dt = datetime(2025, 1, 1, 0, 0, 0, tzinfo=timezone.utc)
@@ -51,3 +48,14 @@ class TestUtilTime(unittest.TestCase):
 
         c = parse_rfc3339("2025-01-01T12:00:00Z")
         self.assertTrue(same_instant(a, c))
+
+    def test_non_utc_inputs_take_the_slow_path(self) -> None:
+        jst = timezone(timedelta(hours=9))
+        a = datetime(2025, 1, 1, 21, 0, 0, tzinfo=jst)
+        b = datetime(2025, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+        self.assertTrue(same_instant(a, b))
+        self.assertEqual(to_rfc3339(a), "2025-01-01T12:00:00.000000Z")
+        with self.assertRaises(ValueError):
+            to_rfc3339(datetime(2025, 1, 1))
+        with self.assertRaises(ValueError):
+            parse_rfc3339("2025-01-01T12:00:00")